@@ -1,5 +1,6 @@
 import streamlit as st
 import json
+import re
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
@@ -13,7 +14,8 @@ from utilities.live_file_sync import (
     load_game_data, 
     get_environment_status,
     is_running_locally,
-    verify_data_sources
+    verify_data_sources,
+    clear_save_file_cache
 )
 from utilities.enhanced_feature_analysis import get_comprehensive_feature_analysis
 from utilities.workforce_management import (
@@ -27,11 +29,13 @@ from utilities.enhanced_workforce_management import (
     analyze_sales_team,
     analyze_research_team,
     analyze_developer_teams,
-    generate_professional_development_plan
+    generate_professional_development_plan,
+    summarize_training_needs
 )
 from utilities.data_center_monitoring import analyze_data_center_performance
-from utilities.focused_team_management import analyze_manageable_team_members
+from utilities.focused_team_management import run_team_analyses
 from utilities.static_evaluation_engine import run_static_evaluation
+from utilities.dashboard_refresh import add_live_status_to_sidebar
 from utilities.smart_recruitment import (
     analyze_hiring_needs,
     filter_candidates_by_role,
@@ -80,6 +84,11 @@ def load_data():
     """Legacy function - redirects to live data loading"""
     return load_live_data()
 
+def clear_data_caches():
+    """Invalidate only the save-data loaders so other cached analyses survive a refresh"""
+    load_data.clear()
+    clear_save_file_cache()
+
 data = load_data()
 
 # --- Business Intelligence Functions ---
@@ -1263,6 +1272,8 @@ def main():
 
     st.sidebar.title("🐦‍🔥 Project Phoenix")
     st.sidebar.markdown("---")
+    add_live_status_to_sidebar(on_refresh=clear_data_caches)
+    st.sidebar.markdown("---")
     
     # Data Source Debug Panel (expandable)
     with st.sidebar.expander("🔧 Data Source Debug", expanded=False):
@@ -1330,7 +1341,7 @@ def show_executive_overview(data):
     
     with col_env3:
         if st.button("🔄 Refresh", help="Refresh dashboard data"):
-            st.cache_data.clear()
+            clear_data_caches()
             # Clear session state data source to force reload
             if 'data_source' in st.session_state:
                 del st.session_state.data_source
@@ -2543,36 +2554,40 @@ def show_human_resources(data):
                     else:
                         st.write(f"❌ No {role} candidates available")
     
-    # Professional Development section
+    # Professional Development section: headline counts are cheap, the full
+    # plan (records and schedule) is only built when the user asks for it
     st.header("📚 Professional Development")
-    dev_plan = generate_professional_development_plan(data)
+    training_summary = summarize_training_needs(data)
     
     col1, col2, col3 = st.columns(3)
     with col1:
-        st.metric("Total Training Opportunities", dev_plan['total_training_opportunities'])
+        st.metric("Total Training Opportunities", training_summary['total_training_opportunities'])
     with col2:
-        st.metric("High Priority Training", len(dev_plan['high_priority_training']))
+        st.metric("High Priority Training", training_summary['high_priority_count'])
     with col3:
-        st.metric("Estimated Cost", f"${dev_plan['estimated_total_cost']:,}")
-    
-    # High Priority Training
-    if dev_plan['high_priority_training']:
-        st.subheader("🚨 Urgent Training Needs")
-        for training in dev_plan['high_priority_training']:
-            with st.expander(f"{training['employee']} - {training['training_need']}", expanded=False):
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.write(f"**Role:** {training['type']}")
-                    st.write(f"**Priority:** {training['priority']}")
-                with col2:
-                    st.write(f"**Duration:** {training['estimated_duration']}")
-                    st.write(f"**Outcome:** {training['expected_outcome']}")
+        st.metric("Estimated Cost", f"${training_summary['estimated_total_cost']:,}")
     
-    # Training Schedule
-    if dev_plan['recommended_schedule']:
-        st.subheader("📅 Recommended Training Schedule")
-        schedule_df = pd.DataFrame(dev_plan['recommended_schedule'])
-        st.dataframe(schedule_df, use_container_width=True)
+    if training_summary['total_training_opportunities'] and st.toggle("📋 Show training plan", value=False):
+        dev_plan = generate_professional_development_plan(data)
+        
+        # High Priority Training
+        if dev_plan['high_priority_training']:
+            st.subheader("🚨 Urgent Training Needs")
+            for training in dev_plan['high_priority_training']:
+                with st.expander(f"{training['employee']} - {training['training_need']}", expanded=False):
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        st.write(f"**Role:** {training['type']}")
+                        st.write(f"**Priority:** {training['priority']}")
+                    with col2:
+                        st.write(f"**Duration:** {training['estimated_duration']}")
+                        st.write(f"**Outcome:** {training['expected_outcome']}")
+        
+        # Training Schedule
+        if dev_plan['recommended_schedule']:
+            st.subheader("📅 Recommended Training Schedule")
+            schedule_df = pd.DataFrame(dev_plan['recommended_schedule'])
+            st.dataframe(schedule_df, use_container_width=True)
     
     # Current Team Analysis
     st.header("👥 Current Team Analysis")
@@ -2582,36 +2597,36 @@ def show_human_resources(data):
     if sales_analysis['sales_executives']:
         st.subheader("💼 Sales Team")
         for exec_data in sales_analysis['sales_executives']:
-            with st.expander(f"🎯 {exec_data['name']} - Sales Executive", expanded=False):
+            with st.expander(f"🎯 {exec_data.name} - Sales Executive", expanded=False):
                 col1, col2 = st.columns(2)
                 with col1:
-                    st.write(f"**Level:** {exec_data['level']}")
-                    st.write(f"**Speed:** {exec_data['speed']}")
-                    st.write(f"**Salary:** ${exec_data['salary']:,}")
+                    st.write(f"**Level:** {exec_data.level}")
+                    st.write(f"**Speed:** {exec_data.speed}")
+                    st.write(f"**Salary:** ${exec_data.salary:,}")
                 with col2:
-                    st.write(f"**Active Leads:** {exec_data['total_leads']}")
-                    st.write(f"**Capacity:** {exec_data['capacity']}")
+                    st.write(f"**Active Leads:** {exec_data.total_leads}")
+                    st.write(f"**Capacity:** {exec_data.capacity}")
                 
-                if exec_data['leads']:
+                if exec_data.leads:
                     st.write("**Lead Portfolio:**")
-                    for i, lead in enumerate(exec_data['leads']):
-                        priority_icon = {'HIGH': '🔴', 'MEDIUM': '🟡', 'LOW': '🟢'}[lead['priority']]
-                        st.write(f"{priority_icon} Lead {i+1}: {lead['impressions']:,} impressions ({lead['priority']} priority)")
+                    for i, lead in enumerate(exec_data.leads):
+                        priority_icon = {'HIGH': '🔴', 'MEDIUM': '🟡', 'LOW': '🟢'}[lead.priority]
+                        st.write(f"{priority_icon} Lead {i+1}: {lead.impressions:,} impressions ({lead.priority} priority)")
     
     # Research Team
     research_analysis = analyze_research_team(data)
     if research_analysis['researchers']:
         st.subheader("🔬 Research Team")
         for researcher in research_analysis['researchers']:
-            with st.expander(f"🧪 {researcher['name']} - Researcher", expanded=False):
+            with st.expander(f"🧪 {researcher.name} - Researcher", expanded=False):
                 col1, col2 = st.columns(2)
                 with col1:
-                    st.write(f"**Level:** {researcher['level']}")
-                    st.write(f"**Speed:** {researcher['speed']:.0f}")
-                    st.write(f"**Salary:** ${researcher['salary']:,}")
+                    st.write(f"**Level:** {researcher.level}")
+                    st.write(f"**Speed:** {researcher.speed:.0f}")
+                    st.write(f"**Salary:** ${researcher.salary:,}")
                 with col2:
-                    st.write(f"**Research Skill:** {researcher.get('research_skill', 'N/A')}")
-                    training = researcher['training_opportunity']
+                    st.write(f"**Research Skill:** {researcher.research_skill}")
+                    training = researcher.training_opportunity
                     if training['has_opportunities']:
                         st.write(f"**Training Needed:** ⚠️ {len(training['training_needs'])} areas")
                     else:
@@ -2625,21 +2640,21 @@ def show_human_resources(data):
         st.subheader("💻 Development Team")
         for dev in all_devs:
             role_icon = {'Developer': '👨‍💻', 'Designer': '🎨', 'LeadDeveloper': '👨‍💼'}
-            icon = role_icon.get(dev['type'], '👤')
+            icon = role_icon.get(dev.type, '👤')
             
-            with st.expander(f"{icon} {dev['name']} - {dev['type']}", expanded=False):
+            with st.expander(f"{icon} {dev.name} - {dev.type}", expanded=False):
                 col1, col2 = st.columns(2)
                 with col1:
-                    st.write(f"**Level:** {dev['level']}")
-                    st.write(f"**Speed:** {dev['speed']:.0f}")
-                    st.write(f"**Salary:** ${dev['salary']:,}")
+                    st.write(f"**Level:** {dev.level}")
+                    st.write(f"**Speed:** {dev.speed:.0f}")
+                    st.write(f"**Salary:** ${dev.salary:,}")
                 with col2:
-                    if dev['skills']:
+                    if dev.skills:
                         st.write("**Skills:**")
-                        for skill, value in dev['skills'].items():
+                        for skill, value in dev.skills.items():
                             st.write(f"  {skill}: {value}")
                     
-                    training = dev['training_opportunities']
+                    training = dev.training_opportunities
                     if training['has_opportunities']:
                         st.write(f"**Training Opportunities:** {len(training['training_needs'])}")
                     else:
@@ -2717,7 +2732,7 @@ def show_daily_standup(data):
     st.markdown("---")
     
     # Use focused team management to get only manageable team members
-    team_analysis = analyze_manageable_team_members(data)
+    team_analysis = run_team_analyses(data)['standup']
     
     if not team_analysis['manageable_team']:
         st.warning("No team members with adjustable work queues found.")
@@ -3026,40 +3041,40 @@ def show_sales_team_meeting(data):
     
     # Individual sales executive analysis
     for exec_data in sales_analysis['sales_executives']:
-        st.header(f"🎯 {exec_data['name']} - Sales Executive Analysis")
+        st.header(f"🎯 {exec_data.name} - Sales Executive Analysis")
         
         # Executive summary
         col1, col2 = st.columns(2)
         with col1:
             st.subheader("📋 Executive Profile")
-            st.write(f"**Level:** {exec_data['level']}")
-            st.write(f"**Speed:** {exec_data['speed']}")
-            st.write(f"**Salary:** ${exec_data['salary']:,}")
-            st.write(f"**Mood:** {exec_data['mood']:.1f}%")
+            st.write(f"**Level:** {exec_data.level}")
+            st.write(f"**Speed:** {exec_data.speed}")
+            st.write(f"**Salary:** ${exec_data.salary:,}")
+            st.write(f"**Mood:** {exec_data.mood:.1f}%")
         
         with col2:
             st.subheader("💼 Current Workload")
-            st.write(f"**Active Leads:** {exec_data['total_leads']}")
-            st.write(f"**Capacity Assessment:** {exec_data['capacity']}")
+            st.write(f"**Active Leads:** {exec_data.total_leads}")
+            st.write(f"**Capacity Assessment:** {exec_data.capacity}")
             
             # Capacity visualization
-            if exec_data['level'] == 'Beginner':
+            if exec_data.level == 'Beginner':
                 max_recommended = 1
-            elif exec_data['level'] == 'Intermediate':
+            elif exec_data.level == 'Intermediate':
                 max_recommended = 2
             else:
                 max_recommended = 3
             
-            capacity_usage = (exec_data['total_leads'] / max_recommended) * 100
+            capacity_usage = (exec_data.total_leads / max_recommended) * 100
             st.progress(min(capacity_usage / 100, 1.0), text=f"Capacity Usage: {capacity_usage:.0f}%")
         
         # Lead portfolio analysis
-        if exec_data['leads']:
+        if exec_data.leads:
             st.subheader("📈 Lead Portfolio Management")
             
             # Create lead analysis table
             lead_data = []
-            for i, lead in enumerate(exec_data['leads']):
+            for i, lead in enumerate(exec_data.leads):
                 # Try to map competitor IDs to company names (simplified)
                 company_names = {
                     'd454a2f2-bded-4b09fdfsg': 'Oregano Corp',
@@ -3067,14 +3082,14 @@ def show_sales_team_meeting(data):
                     '1ce30d18-ca93-4299-9160-dab4e1bd9711': 'Greenbook Ltd'
                 }
                 
-                company_name = company_names.get(lead['competitor_id'], f"Company {i+1}")
+                company_name = company_names.get(lead.competitor_id, f"Company {i+1}")
                 
                 lead_data.append({
                     'Company': company_name,
-                    'Impressions': f"{lead['impressions']:,}",
-                    'Priority': lead['priority'],
-                    'Value Assessment': lead['urgency'],
-                    'Last Contact': lead['timestamp'][:10] if lead['timestamp'] else 'N/A'
+                    'Impressions': f"{lead.impressions:,}",
+                    'Priority': lead.priority,
+                    'Value Assessment': lead.urgency,
+                    'Last Contact': lead.timestamp[:10] if lead.timestamp else 'N/A'
                 })
             
             df_leads = pd.DataFrame(lead_data)
@@ -3083,11 +3098,11 @@ def show_sales_team_meeting(data):
             # Lead prioritization strategy
             st.subheader("🎯 Recommended Lead Strategy")
             
-            if exec_data['level'] == 'Beginner' and len(exec_data['leads']) > 1:
-                highest_lead = exec_data['leads'][0]  # Already sorted by priority
-                company_name = company_names.get(highest_lead['competitor_id'], 'Top Lead')
+            if exec_data.level == 'Beginner' and len(exec_data.leads) > 1:
+                highest_lead = exec_data.leads[0]  # Already sorted by priority
+                company_name = company_names.get(highest_lead.competitor_id, 'Top Lead')
                 
-                st.warning(f"**Focus Strategy Recommended**: {exec_data['name']} should focus exclusively on **{company_name}** ({highest_lead['impressions']:,} impressions)")
+                st.warning(f"**Focus Strategy Recommended**: {exec_data.name} should focus exclusively on **{company_name}** ({highest_lead.impressions:,} impressions)")
                 st.write("**Rationale**: Beginner-level executives perform better with single-lead focus")
                 st.write("**Action Plan**:")
                 st.write("1. ✅ Prioritize all communication with this lead")
@@ -3098,34 +3113,34 @@ def show_sales_team_meeting(data):
             # Individual lead recommendations
             st.subheader("📋 Lead-by-Lead Action Plan")
             
-            for i, lead in enumerate(exec_data['leads']):
-                company_name = company_names.get(lead['competitor_id'], f"Company {i+1}")
+            for i, lead in enumerate(exec_data.leads):
+                company_name = company_names.get(lead.competitor_id, f"Company {i+1}")
                 
-                with st.expander(f"{lead['priority']} Priority: {company_name} ({lead['impressions']:,} impressions)", expanded=i==0):
+                with st.expander(f"{lead.priority} Priority: {company_name} ({lead.impressions:,} impressions)", expanded=i==0):
                     
                     # Display quantitative lead data only
                     col1, col2, col3 = st.columns(3)
                     
                     with col1:
-                        st.metric("Lead Value", f"{lead['impressions']:,} impressions")
+                        st.metric("Lead Value", f"{lead.impressions:,} impressions")
                     with col2:
-                        st.metric("Priority Level", lead['priority'])
+                        st.metric("Priority Level", lead.priority)
                     with col3:
                         # Calculate contact urgency based on data
-                        if lead['priority'] == 'HIGH':
+                        if lead.priority == 'HIGH':
                             st.metric("Contact Within", "24 hours", delta="URGENT")
-                        elif lead['priority'] == 'MEDIUM':
+                        elif lead.priority == 'MEDIUM':
                             st.metric("Contact Within", "3-5 days", delta="Normal")
                         else:
                             st.metric("Contact Within", "Weekly check", delta="Low")
                     
                     # Data-driven action based on impression thresholds
                     st.markdown("**Data-Driven Actions:**")
-                    if lead['impressions'] >= 200000:
+                    if lead.impressions >= 200000:
                         st.info("📊 High-value lead detected (>200k impressions)")
                         st.markdown("• **Action**: Schedule immediate contact")
                         st.markdown("• **Data Point**: Premium client tier qualified")
-                    elif lead['impressions'] >= 50000:
+                    elif lead.impressions >= 50000:
                         st.info("📊 Medium-value lead (50k-200k impressions)")
                         st.markdown("• **Action**: Contact within 3 business days")
                         st.markdown("• **Data Point**: Standard client tier")
@@ -3135,7 +3150,7 @@ def show_sales_team_meeting(data):
                         st.markdown("• **Data Point**: Entry-level client tier")
         
         else:
-            st.info(f"{exec_data['name']} currently has no active leads.")
+            st.info(f"{exec_data.name} currently has no active leads.")
             
             # Data-driven lead generation metrics instead of abstract advice
             st.markdown("**Lead Generation Status:**")
@@ -3149,11 +3164,11 @@ def show_sales_team_meeting(data):
         
         # Calculate actual performance data
         total_pipeline_value = sum(
-            sum(lead['impressions'] for lead in exec_data['leads'])
+            sum(lead.impressions for lead in exec_data.leads)
             for exec_data in sales_analysis['sales_executives']
         )
         active_leads_count = sum(
-            len(exec_data['leads']) 
+            len(exec_data.leads) 
             for exec_data in sales_analysis['sales_executives']
         )
         
@@ -3171,7 +3186,7 @@ def show_sales_team_meeting(data):
     
     # Calculate team performance indicators based on actual data
     total_impressions = sum(
-        sum(lead['impressions'] for lead in exec_data['leads']) 
+        sum(lead.impressions for lead in exec_data.leads) 
         for exec_data in sales_analysis['sales_executives']
     )
     
@@ -3191,15 +3206,15 @@ def show_sales_team_meeting(data):
     
     action_items = []
     for exec_data in sales_analysis['sales_executives']:
-        name = exec_data['name']
+        name = exec_data.name
         
-        if not exec_data['leads']:
+        if not exec_data.leads:
             action_items.append(f"🔍 **{name}**: Begin immediate lead generation activities")
-        elif exec_data['level'] == 'Beginner' and len(exec_data['leads']) > 1:
+        elif exec_data.level == 'Beginner' and len(exec_data.leads) > 1:
             action_items.append(f"🎯 **{name}**: Focus on highest-priority lead only")
         
-        for lead in exec_data['leads']:
-            if lead['priority'] == 'HIGH':
+        for lead in exec_data.leads:
+            if lead.priority == 'HIGH':
                 action_items.append(f"🚨 **{name}**: Contact high-priority lead within 24 hours")
                 break
     
@@ -3440,6 +3455,24 @@ def show_data_center_monitoring(data):
     current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     st.markdown(f"*Last updated: {current_time} | Data Center Monitoring System v1.0*")
 
+# Implementation step keys look like "step_1", "step_2", ...
+_STEP_KEY = re.compile(r'step_(\d+)$')
+
+# (priority, section header, expander icon, expanded by default)
+_PRIORITY_VIEW = (
+    ("CRITICAL", "🚨 Critical Actions", "🔴", True),
+    ("HIGH", "🟡 High Priority Actions", "🟡", True),
+    ("MEDIUM", "🔵 Medium Priority Actions", "🔵", False),
+    ("LOW", "🟢 Low Priority Actions", "🟢", False),
+)
+
+def _keyed_container(key):
+    """Container with a stable key so reruns diff instead of remounting (key needs Streamlit >= 1.39)"""
+    try:
+        return st.container(key=key)
+    except TypeError:
+        return st.container()
+
 def show_static_evaluation(data):
     """Display static evaluation engine results with data-driven insights"""
     
@@ -3454,14 +3487,16 @@ def show_static_evaluation(data):
     st.header("📊 Evaluation Summary")
     
     summary = evaluation_result['evaluation_summary']
+    total_metrics = summary['total_metrics_calculated']
+    total_alerts_count = summary['total_threshold_alerts']
     
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.metric("Metrics Calculated", summary['total_metrics_calculated'])
+        st.metric("Metrics Calculated", total_metrics)
     
     with col2:
-        st.metric("Threshold Alerts", summary['total_threshold_alerts'])
+        st.metric("Threshold Alerts", total_alerts_count)
     
     with col3:
         st.metric("Critical Actions", summary['critical_actions_required'])
@@ -3515,9 +3550,11 @@ def show_static_evaluation(data):
         # Role breakdown
         if util_metrics['by_role']:
             st.markdown("**Utilization by Role:**")
-            for role, role_data in util_metrics['by_role'].items():
-                utilization = role_data['utilization_percent']
-                st.write(f"• **{role}**: {utilization:.1f}% ({role_data['assigned']}/{role_data['total']})")
+            role_lines = [
+                f"• **{role}**: {role_data['utilization_percent']:.1f}% ({role_data['assigned']}/{role_data['total']})"
+                for role, role_data in util_metrics['by_role'].items()
+            ]
+            st.markdown("  \n".join(role_lines))
     
     # Financial Runway
     with st.expander("💰 Financial Analysis", expanded=True):
@@ -3585,35 +3622,22 @@ def show_static_evaluation(data):
     actionable_outputs = evaluation_result['actionable_outputs']
     
     if actionable_outputs:
-        # Group by priority
-        critical_actions = [a for a in actionable_outputs if a['priority'] == 'CRITICAL']
-        high_actions = [a for a in actionable_outputs if a['priority'] == 'HIGH']
-        medium_actions = [a for a in actionable_outputs if a['priority'] == 'MEDIUM']
-        low_actions = [a for a in actionable_outputs if a['priority'] == 'LOW']
-        
-        if critical_actions:
-            st.subheader("🚨 Critical Actions")
-            for action in critical_actions:
-                with st.expander(f"🔴 {action['game_command']}", expanded=True):
-                    display_action_details(action)
-        
-        if high_actions:
-            st.subheader("🟡 High Priority Actions")
-            for action in high_actions:
-                with st.expander(f"🟡 {action['game_command']}", expanded=True):
-                    display_action_details(action)
-        
-        if medium_actions:
-            st.subheader("🔵 Medium Priority Actions")
-            for action in medium_actions:
-                with st.expander(f"🔵 {action['game_command']}", expanded=False):
-                    display_action_details(action)
-        
-        if low_actions:
-            st.subheader("🟢 Low Priority Actions")
-            for action in low_actions:
-                with st.expander(f"🟢 {action['game_command']}", expanded=False):
-                    display_action_details(action)
+        # Group by priority in a single pass
+        buckets = {priority: [] for priority, _, _, _ in _PRIORITY_VIEW}
+        for action in actionable_outputs:
+            bucket = buckets.get(action['priority'])
+            if bucket is not None:
+                bucket.append(action)
+        
+        for priority, header, icon, expanded in _PRIORITY_VIEW:
+            actions = buckets[priority]
+            if not actions:
+                continue
+            st.subheader(header)
+            for index, action in enumerate(actions):
+                with _keyed_container(f"action_{priority}_{index}"):
+                    with st.expander(f"{icon} {action['game_command']}", expanded=expanded):
+                        display_action_details(action)
     else:
         st.success("✅ No immediate actions required - all systems optimal")
     
@@ -3629,8 +3653,8 @@ def show_static_evaluation(data):
         
     with col2:
         st.markdown("**Processing Results**")
-        st.markdown(f"• Metrics calculated: {summary['total_metrics_calculated']}")
-        st.markdown(f"• Alerts generated: {summary['total_threshold_alerts']}")
+        st.markdown(f"• Metrics calculated: {total_metrics}")
+        st.markdown(f"• Alerts generated: {total_alerts_count}")
         st.markdown(f"• Actions created: {len(actionable_outputs)}")
     
     # Next Evaluation Timing
@@ -3644,33 +3668,42 @@ def show_static_evaluation(data):
 
 def display_action_details(action):
     """Display detailed information about a specific action"""
+    action_type, specific_action, target_metric, current_value, target_value, priority, game_command = (
+        action['action_type'], action['specific_action'], action['target_metric'],
+        action['current_value'], action['target_value'], action['priority'], action['game_command']
+    )
     
     col1, col2 = st.columns(2)
     
     with col1:
-        st.markdown(f"**Action Type**: {action['action_type']}")
-        st.markdown(f"**Specific Action**: {action['specific_action']}")
-        st.markdown(f"**Target Metric**: {action['target_metric']}")
+        st.markdown(f"**Action Type**: {action_type}")
+        st.markdown(f"**Specific Action**: {specific_action}")
+        st.markdown(f"**Target Metric**: {target_metric}")
         
     with col2:
-        st.markdown(f"**Current Value**: {action['current_value']}")
-        st.markdown(f"**Target Value**: {action['target_value']}")
-        st.markdown(f"**Priority**: {action['priority']}")
+        st.markdown(f"**Current Value**: {current_value}")
+        st.markdown(f"**Target Value**: {target_value}")
+        st.markdown(f"**Priority**: {priority}")
     
     # Implementation details
     if 'implementation' in action:
         st.markdown("**Implementation Steps**:")
         impl = action['implementation']
         
-        for key, value in impl.items():
-            if key.startswith('step_'):
-                step_num = key.replace('step_', '')
-                st.markdown(f"   {step_num}. {value}")
-            elif key == 'expected_result':
-                st.markdown(f"**Expected Result**: {value}")
+        steps = sorted(
+            (int(match.group(1)), value)
+            for match, value in ((_STEP_KEY.match(key), value) for key, value in impl.items())
+            if match
+        )
+        if steps:
+            st.markdown("\n".join(f"{step_num}. {value}" for step_num, value in steps))
+        
+        expected_result = impl.get('expected_result')
+        if expected_result:
+            st.markdown(f"**Expected Result**: {expected_result}")
     
-    # Show game command prominently
-    st.code(action['game_command'], language='text')
+    # Show game command prominently (unstyled - commands are plain text, nothing to highlight)
+    st.code(game_command, language=None)
 
 if __name__ == "__main__":
     main()
@@ -4,31 +4,50 @@ This script helps verify that the fallback system works in production
 """
 
 import streamlit as st
-import json
+import pandas as pd
 from pathlib import Path
-from utilities.live_file_sync import load_game_data, LOCAL_SAVE_PATH, GAME_SAVE_PATH
+from utilities.live_file_sync import (
+    load_game_data, read_save_file, summarize_save_file, LOCAL_SAVE_PATH, GAME_SAVE_PATH
+)
 
 st.title("🔧 Deployment Verification Test")
 st.markdown("**Testing fallback system for Streamlit.app deployment**")
 
-# Environment info
-st.header("🌍 Environment Information")
-col1, col2 = st.columns(2)
+# Resolve file state once per run instead of re-stat'ing in every section
+_game_exists = GAME_SAVE_PATH.exists()
+_local_stat = LOCAL_SAVE_PATH.stat() if LOCAL_SAVE_PATH.exists() else None
+_local_exists = _local_stat is not None
+_local_abs = LOCAL_SAVE_PATH.absolute()
 
-with col1:
-    st.metric("Current Working Dir", str(Path.cwd().name))
-    st.metric("Script Directory", str(Path(__file__).parent.name))
-    
-with col2:
-    st.metric("Game Save Exists", "✅" if GAME_SAVE_PATH.exists() else "❌")
-    st.metric("Backup Exists", "✅" if LOCAL_SAVE_PATH.exists() else "❌")
+# Environment and path diagnostics, rendered as one table
+st.header("🌍 Environment & Path Verification")
+diagnostics = [
+    ("Current Working Dir", str(Path.cwd().name)),
+    ("Script Directory", str(Path(__file__).parent.name)),
+    ("Game Save Exists", "✅" if _game_exists else "❌"),
+    ("Backup Exists", "✅" if _local_exists else "❌"),
+    ("Game Save Path", str(GAME_SAVE_PATH)),
+    ("Backup Path", str(_local_abs)),
+]
 
-# Path verification
-st.header("📁 Path Verification")
-st.code(f"""
-Game Save Path: {GAME_SAVE_PATH}
-Backup Path: {LOCAL_SAVE_PATH.absolute()}
-""")
+if not _local_exists:
+    # Show file search results alongside the other diagnostics
+    search_paths = [
+        Path("save_data/sg_momentum ai.json"),
+        Path("live_analytics/save_data/sg_momentum ai.json"),
+        Path("../save_data/sg_momentum ai.json"),
+        LOCAL_SAVE_PATH
+    ]
+    diagnostics.extend(
+        (f"Search: {path.absolute()}", "✅ FOUND" if path.exists() else "❌ NOT FOUND")
+        for path in search_paths
+    )
+
+st.dataframe(
+    pd.DataFrame(diagnostics, columns=["Check", "Value"]),
+    use_container_width=True,
+    hide_index=True
+)
 
 # Data loading test
 st.header("📊 Data Loading Test")
@@ -72,39 +91,38 @@ if st.button("🧪 Test Data Loading", type="primary"):
 # Backup file verification
 st.header("🗃️ Backup File Verification")
 
-if LOCAL_SAVE_PATH.exists():
+if _local_exists:
     try:
-        with open(LOCAL_SAVE_PATH, 'r') as f:
-            backup_data = json.load(f)
+        # Only lengths are needed here, so keep the summary rather than the parsed save
+        backup_summary = summarize_save_file(LOCAL_SAVE_PATH)
         
-        st.success(f"✅ Backup file is valid JSON ({LOCAL_SAVE_PATH.stat().st_size:,} bytes)")
+        st.success(f"✅ Backup file is valid JSON ({_local_stat.st_size:,} bytes)")
         
         # Show backup file stats
         col1, col2, col3 = st.columns(3)
         with col1:
-            st.metric("File Size", f"{LOCAL_SAVE_PATH.stat().st_size:,} bytes")
+            st.metric("File Size", f"{_local_stat.st_size:,} bytes")
         with col2:
-            st.metric("Features in Backup", len(backup_data.get('featureInstances', [])))
+            st.metric("Features in Backup", (backup_summary.get('featureInstances', (None, 0))[1] or 0))
         with col3:
-            st.metric("Transactions in Backup", len(backup_data.get('transactions', [])))
-            
+            st.metric("Transactions in Backup", (backup_summary.get('transactions', (None, 0))[1] or 0))
+
+        # Inspect top-level keys without rendering the full save tree
+        with st.expander("🗂️ Backup Data Keys", expanded=False):
+            st.json({
+                key: f"<{type_name}, len={length if length is not None else 'n/a'}>"
+                for key, (type_name, length) in backup_summary.items()
+            }, expanded=False)
+            selected_key = st.selectbox(
+                "Inspect key", list(backup_summary.keys()), index=None, placeholder="Choose a key"
+            )
+            if selected_key is not None:
+                st.json(read_save_file(LOCAL_SAVE_PATH)[selected_key], expanded=False)
+
     except Exception as e:
         st.error(f"❌ Backup file error: {e}")
 else:
-    st.warning("⚠️ Backup file not found")
-    
-    # Show file search results
-    search_paths = [
-        Path("save_data/sg_momentum ai.json"),
-        Path("live_analytics/save_data/sg_momentum ai.json"),
-        Path("../save_data/sg_momentum ai.json"),
-        LOCAL_SAVE_PATH
-    ]
-    
-    st.write("**File search results:**")
-    for path in search_paths:
-        exists = path.exists()
-        st.write(f"• `{path.absolute()}` - {'✅ FOUND' if exists else '❌ NOT FOUND'}")
+    st.warning("⚠️ Backup file not found - see the search results in the diagnostics table above")
 
 # Instructions for deployment
 st.header("🚀 Deployment Instructions")
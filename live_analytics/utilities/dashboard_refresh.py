@@ -9,7 +9,17 @@ import json
 import time
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable
+
+try:
+    import orjson
+except ImportError:  # Optional dependency - fall back to stdlib parser
+    orjson = None
+
+try:
+    import streamlit as st
+except ImportError:  # Headless use (CLI monitor, scripts) does not need Streamlit
+    st = None
 
 # Path to the trigger file created by update_save_data.py
 TRIGGER_FILE = Path(__file__).parent.parent / "save_data" / ".update_trigger"
@@ -24,9 +34,11 @@ def get_last_update_info() -> Optional[Dict[str, Any]]:
     """
     try:
         if TRIGGER_FILE.exists():
+            if orjson is not None:
+                return orjson.loads(TRIGGER_FILE.read_bytes())
             with open(TRIGGER_FILE, 'r', encoding='utf-8') as f:
                 return json.load(f)
-    except (json.JSONDecodeError, FileNotFoundError):
+    except (ValueError, FileNotFoundError):
         pass
     return None
 
@@ -37,9 +49,8 @@ def get_update_count() -> int:
     return info.get("update_count", 0) if info else 0
 
 
-def get_last_update_time() -> Optional[datetime]:
-    """Get the timestamp of the last update."""
-    info = get_last_update_info()
+def _parse_last_update(info: Optional[Dict[str, Any]]) -> Optional[datetime]:
+    """Extract the last update timestamp from already-loaded trigger info."""
     if info and "last_update" in info:
         try:
             return datetime.fromisoformat(info["last_update"])
@@ -48,6 +59,11 @@ def get_last_update_time() -> Optional[datetime]:
     return None
 
 
+def get_last_update_time() -> Optional[datetime]:
+    """Get the timestamp of the last update."""
+    return _parse_last_update(get_last_update_info())
+
+
 def should_refresh_dashboard(last_known_count: int = 0) -> bool:
     """
     Check if the dashboard should refresh based on update count.
@@ -62,6 +78,19 @@ def should_refresh_dashboard(last_known_count: int = 0) -> bool:
     return current_count > last_known_count
 
 
+def _format_since(last_update: Optional[datetime], now: datetime) -> str:
+    """Format the time elapsed between ``last_update`` and ``now``."""
+    if last_update:
+        seconds = (now - last_update).total_seconds()
+        if seconds < 60:
+            return f"Updated {int(seconds)} seconds ago"
+        elif seconds < 3600:
+            return f"Updated {int(seconds / 60)} minutes ago"
+        else:
+            return f"Updated {last_update.strftime('%H:%M:%S')}"
+    return "No updates detected"
+
+
 def format_last_update_display() -> str:
     """
     Format last update time for display in the dashboard.
@@ -69,16 +98,7 @@ def format_last_update_display() -> str:
     Returns:
         Formatted string showing last update time
     """
-    last_update = get_last_update_time()
-    if last_update:
-        time_diff = datetime.now() - last_update
-        if time_diff.total_seconds() < 60:
-            return f"Updated {int(time_diff.total_seconds())} seconds ago"
-        elif time_diff.total_seconds() < 3600:
-            return f"Updated {int(time_diff.total_seconds() / 60)} minutes ago"
-        else:
-            return f"Updated {last_update.strftime('%H:%M:%S')}"
-    return "No updates detected"
+    return _format_since(get_last_update_time(), datetime.now())
 
 
 def get_dashboard_status() -> Dict[str, Any]:
@@ -89,7 +109,6 @@ def get_dashboard_status() -> Dict[str, Any]:
         Dict with status info for dashboard display
     """
     info = get_last_update_info()
-    last_update = get_last_update_time()
     
     if not info:
         return {
@@ -100,10 +119,12 @@ def get_dashboard_status() -> Dict[str, Any]:
             "time_display": "No updates yet"
         }
     
-    # Calculate time since last update
+    # Calculate time since last update against a single clock reading
+    last_update = _parse_last_update(info)
+    now = datetime.now()
     time_since_update = None
     if last_update:
-        time_since_update = (datetime.now() - last_update).total_seconds()
+        time_since_update = (now - last_update).total_seconds()
     
     # Determine status
     if time_since_update and time_since_update < 30:
@@ -121,39 +142,124 @@ def get_dashboard_status() -> Dict[str, Any]:
         "message": message,
         "update_count": info.get("update_count", 0),
         "last_update": last_update,
-        "time_display": format_last_update_display(),
+        "time_display": _format_since(last_update, now),
         "source_file": info.get("source_file", "Unknown")
     }
 
 
 # Example usage for Streamlit
-def add_live_status_to_sidebar():
-    """
-    Add live update status to Streamlit sidebar.
-    Call this function in your Streamlit dashboard.
-    """
-    import streamlit as st
-    
+_live_status_fragment = None
+
+
+def _render_live_status(on_refresh: Optional[Callable[[], None]] = None) -> None:
+    """Render the live status widgets into the current container."""
     status = get_dashboard_status()
     
-    st.sidebar.markdown("### 📡 Live Data Status")
-    st.sidebar.write(status["message"])
-    st.sidebar.write(f"**Updates:** {status['update_count']}")
-    st.sidebar.write(f"**Last Update:** {status['time_display']}")
+    st.markdown("### 📡 Live Data Status")
+    st.write(status["message"])
+    st.write(f"**Updates:** {status['update_count']}")
+    st.write(f"**Last Update:** {status['time_display']}")
     
     # Auto-refresh button
-    if st.sidebar.button("🔄 Force Refresh", help="Manually refresh the dashboard data"):
-        st.cache_data.clear()
+    if st.button("🔄 Force Refresh", help="Manually refresh the dashboard data"):
+        if on_refresh is not None:
+            on_refresh()
+        else:
+            st.cache_data.clear()
         st.rerun()
     
     # Auto-refresh logic (check every 30 seconds)
     if status["status"] == "active":
-        st.sidebar.success("✅ Real-time monitoring active")
+        st.success("✅ Real-time monitoring active")
         # You can add auto-refresh logic here if needed
     elif status["status"] == "recent":
-        st.sidebar.warning("⏰ New data available")
+        st.warning("⏰ New data available")
     else:
-        st.sidebar.error("❌ No recent updates")
+        st.error("❌ No recent updates")
+
+
+def add_live_status_to_sidebar(on_refresh: Optional[Callable[[], None]] = None):
+    """
+    Add live update status to Streamlit sidebar.
+    Call this function in your Streamlit dashboard.
+    
+    The status block runs as a fragment refreshing every 5 seconds, so
+    it updates without rerunning the rest of the dashboard script.
+    
+    Args:
+        on_refresh: Invalidates the dashboard's data caches when Force
+            Refresh is pressed. Defaults to clearing every st.cache_data entry.
+    """
+    global _live_status_fragment
+    if st is None:
+        return
+    
+    if _live_status_fragment is None:
+        fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+        if fragment is not None:
+            _live_status_fragment = fragment(run_every=5)(_render_live_status)
+        else:
+            _live_status_fragment = _render_live_status
+    
+    with st.sidebar:
+        _live_status_fragment(on_refresh)
+
+
+def monitor_updates(last_count: int = 0, poll_interval: float = 5.0) -> None:
+    """
+    Print a line whenever the trigger file reports a new update.
+    
+    Blocks on watchdog file events when watchdog is installed, so the
+    trigger file is only read after it actually changes. Falls back to
+    polling every ``poll_interval`` seconds otherwise.
+    
+    Args:
+        last_count: The last update count already reported
+        poll_interval: Seconds between checks in polling mode
+    """
+    state = {"last_count": last_count}
+    
+    def report_if_updated():
+        if should_refresh_dashboard(state["last_count"]):
+            new_status = get_dashboard_status()
+            print(f"🔄 New update detected! Count: {new_status['update_count']}")
+            state["last_count"] = new_status['update_count']
+    
+    try:
+        from watchdog.observers import Observer
+        from watchdog.events import FileSystemEventHandler
+    except ImportError:
+        Observer = None
+    
+    if Observer is None:
+        try:
+            while True:
+                time.sleep(poll_interval)
+                report_if_updated()
+        except KeyboardInterrupt:
+            print("\n👋 Monitoring stopped.")
+        return
+    
+    class TriggerFileHandler(FileSystemEventHandler):
+        def on_any_event(self, event):
+            if event.is_directory or event.event_type not in ("created", "modified", "moved"):
+                return
+            paths = (event.src_path, getattr(event, "dest_path", ""))
+            if any(Path(p).name == TRIGGER_FILE.name for p in paths if p):
+                report_if_updated()
+    
+    TRIGGER_FILE.parent.mkdir(parents=True, exist_ok=True)
+    observer = Observer()
+    observer.schedule(TriggerFileHandler(), str(TRIGGER_FILE.parent), recursive=False)
+    observer.start()
+    try:
+        while observer.is_alive():
+            observer.join(1)
+    except KeyboardInterrupt:
+        print("\n👋 Monitoring stopped.")
+    finally:
+        observer.stop()
+        observer.join()
 
 
 if __name__ == "__main__":
@@ -171,14 +277,4 @@ if __name__ == "__main__":
         print(f"Last Update: {status['last_update'].isoformat()}")
     
     print("\nMonitoring for updates... (Press Ctrl+C to stop)")
-    last_count = status['update_count']
-    
-    try:
-        while True:
-            time.sleep(5)  # Check every 5 seconds
-            if should_refresh_dashboard(last_count):
-                new_status = get_dashboard_status()
-                print(f"🔄 New update detected! Count: {new_status['update_count']}")
-                last_count = new_status['update_count']
-    except KeyboardInterrupt:
-        print("\n👋 Monitoring stopped.")
\ No newline at end of file
+    monitor_updates(status['update_count'])
\ No newline at end of file
@@ -4,9 +4,74 @@ Monitors server performance, CU usage, and hardware metrics
 """
 
 import json
-from typing import Dict, List, Any, Tuple
+import re
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
+from typing import Dict, List, Any, Optional, Tuple
+import numpy as np
 import streamlit as st
+from utilities.live_file_sync import SAVE_HASH_FUNCS
+from utilities.save_records import flatten_inventory
 
+# Hardware keyword -> component type, in classification priority order
+HARDWARE_TYPE_KEYWORDS = (
+    ('server', 'Server Hardware'),
+    ('network', 'Network Infrastructure'),
+    ('database', 'Database Systems'),
+    ('security', 'Security Systems'),
+)
+
+# Inventory items whose names contain any of these count as data center hardware
+HARDWARE_FILTER_TERMS = frozenset(('server', 'hardware', 'network', 'database'))
+
+def _underuse_penalty(utilization_rate: float) -> float:
+    """Efficiency lost to idle capacity below 30% utilization"""
+    return (30 - utilization_rate) * 0.5
+
+def _overload_penalty(utilization_rate: float) -> float:
+    """Efficiency lost to performance degradation above 85% utilization"""
+    return (utilization_rate - 85) * 2
+
+_ADD_CAPACITY = ('URGENT', 'Add server capacity immediately', 'risk of performance issues', 'Hardware Upgrade')
+_PLAN_CAPACITY = ('HIGH', 'Plan server capacity expansion', 'approaching capacity limits', 'Capacity Planning')
+_OPTIMIZE_SERVERS = ('LOW', 'Optimize server configuration', 'servers may be underutilized', 'Optimization')
+
+# CU utilization (%) tiers: utilization at or above a threshold moves up one tier.
+# Each tier is (status, status message, efficiency penalty, recommendation).
+CU_TIER_THRESHOLDS = (30, 50, 75, 85, 90)
+CU_TIERS = (
+    ('OPTIMAL', 'Low server utilization', _underuse_penalty, _OPTIMIZE_SERVERS),
+    ('OPTIMAL', 'Low server utilization', None, None),
+    ('GOOD', 'Normal server operation', None, None),
+    ('WARNING', 'High server utilization', None, _PLAN_CAPACITY),
+    ('WARNING', 'High server utilization', _overload_penalty, _PLAN_CAPACITY),
+    ('CRITICAL', 'Server capacity near maximum', _overload_penalty, _ADD_CAPACITY),
+)
+
+# Minimum stock of each hardware type for a healthy data center
+REQUIRED_HARDWARE_TYPES = ('Server Hardware', 'Network Infrastructure', 'Database Systems', 'Security Systems')
+REQUIRED_HARDWARE_MINIMUMS = np.array([3, 2, 2, 1], dtype=np.int32)
+
+# Hardware health by issue count: 0, 1-2, 3-4, 5+
+HEALTH_ISSUE_THRESHOLDS = (0, 2, 4)
+HEALTH_LEVELS = ((100, 'EXCELLENT'), (75, 'GOOD'), (50, 'FAIR'), (25, 'POOR'))
+
+# Capacity alerts at 85% (warning) and 95% (critical) utilization
+CAPACITY_ALERT_THRESHOLDS = (85, 95)
+CAPACITY_ALERT_LEVELS = (
+    None,
+    ('WARNING', 'Server capacity approaching limits', 'Plan capacity expansion or optimization'),
+    ('CRITICAL', 'Server capacity at maximum - immediate action required',
+     'Add server capacity or optimize workloads immediately'),
+)
+
+# Single scan over a lowercased name; the lookahead reports overlapping keyword hits
+_HARDWARE_KEYWORD_PATTERN = re.compile(r'(?=(server|hardware|network|database|security))')
+
+@st.cache_data(show_spinner=False, hash_funcs=SAVE_HASH_FUNCS)
 def analyze_data_center_performance(data: Dict[str, Any]) -> Dict[str, Any]:
     """Analyze data center performance and server metrics"""
     
@@ -14,18 +79,26 @@ def analyze_data_center_performance(data: Dict[str, Any]) -> Dict[str, Any]:
     # Note: Actual field names may vary - adjust based on real save file structure
     
     server_data = extract_server_metrics(data)
-    cu_analysis = analyze_cu_usage(server_data)
-    hardware_status = assess_hardware_health(server_data)
-    optimization_opportunities = identify_optimization_opportunities(cu_analysis, hardware_status)
     
-    return {
-        'server_metrics': server_data,
-        'cu_analysis': cu_analysis,
-        'hardware_status': hardware_status,
-        'optimization_opportunities': optimization_opportunities,
-        'sysadmin_tasks': generate_sysadmin_tasks(cu_analysis, hardware_status),
-        'performance_alerts': generate_performance_alerts(server_data)
-    }
+    # Independent sub-analyses run concurrently; each stage only waits on its inputs
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        cu_future = executor.submit(analyze_cu_usage, server_data)
+        hardware_future = executor.submit(assess_hardware_health, server_data)
+        cu_analysis = cu_future.result()
+        hardware_status = hardware_future.result()
+        
+        optimization_future = executor.submit(identify_optimization_opportunities, cu_analysis, hardware_status)
+        tasks_future = executor.submit(generate_sysadmin_tasks, cu_analysis, hardware_status)
+        alerts_future = executor.submit(generate_performance_alerts, server_data, cu_analysis)
+        
+        return {
+            'server_metrics': server_data,
+            'cu_analysis': cu_analysis,
+            'hardware_status': hardware_status,
+            'optimization_opportunities': optimization_future.result(),
+            'sysadmin_tasks': tasks_future.result(),
+            'performance_alerts': alerts_future.result()
+        }
 
 def extract_server_metrics(data: Dict[str, Any]) -> Dict[str, Any]:
     """Extract server and CU metrics from game data"""
@@ -59,32 +132,47 @@ def extract_server_metrics(data: Dict[str, Any]) -> Dict[str, Any]:
             server_metrics['cu_usage'] = cu_data
     
     # Check for hardware components that affect server performance
-    inventory = data.get('inventory', {})
-    for component_name, component_data in inventory.items():
-        if any(term in component_name.lower() for term in ['server', 'hardware', 'network', 'database']):
+    inventory = flatten_inventory(data.get('inventory', {}))
+    for component_name, quantity in inventory.items():
+        component_type = _classify_cached(component_name.lower())
+        if component_type is not None:
             server_metrics['hardware_components'].append({
                 'name': component_name,
-                'quantity': component_data.get('amount', 0) if isinstance(component_data, dict) else component_data,
-                'type': classify_hardware_component(component_name)
+                'quantity': quantity,
+                'type': component_type
             })
     
     return server_metrics
 
+def match_hardware_keywords(name_lower: str) -> frozenset:
+    """Return every hardware keyword contained in an already-lowercased name"""
+    
+    return frozenset(_HARDWARE_KEYWORD_PATTERN.findall(name_lower))
+
+def hardware_type_for_keywords(keywords: frozenset) -> str:
+    """Map matched hardware keywords to a component type by priority"""
+    
+    for keyword, component_type in HARDWARE_TYPE_KEYWORDS:
+        if keyword in keywords:
+            return component_type
+    return 'General Hardware'
+
+_component_type = itemgetter('type')
+_component_quantity = itemgetter('quantity')
+
+@lru_cache(maxsize=2048)
+def _classify_cached(name_lower: str) -> Optional[str]:
+    """Hardware type for a lowercased inventory name, or None if it is not data center hardware"""
+    
+    keywords = match_hardware_keywords(name_lower)
+    if not keywords & HARDWARE_FILTER_TERMS:
+        return None
+    return hardware_type_for_keywords(keywords)
+
 def classify_hardware_component(component_name: str) -> str:
     """Classify hardware components by their function"""
     
-    name_lower = component_name.lower()
-    
-    if 'server' in name_lower:
-        return 'Server Hardware'
-    elif 'network' in name_lower:
-        return 'Network Infrastructure'
-    elif 'database' in name_lower:
-        return 'Database Systems'
-    elif 'security' in name_lower:
-        return 'Security Systems'
-    else:
-        return 'General Hardware'
+    return hardware_type_for_keywords(match_hardware_keywords(component_name.lower()))
 
 def analyze_cu_usage(server_data: Dict[str, Any]) -> Dict[str, Any]:
     """Analyze CU (Compute Unit) usage and efficiency"""
@@ -94,133 +182,73 @@ def analyze_cu_usage(server_data: Dict[str, Any]) -> Dict[str, Any]:
     
     utilization_rate = (current_cu / max_cu) * 100 if max_cu > 0 else 0
     
-    # Determine CU status
-    if utilization_rate >= 90:
-        cu_status = 'CRITICAL'
-        status_message = 'Server capacity near maximum'
-    elif utilization_rate >= 75:
-        cu_status = 'WARNING'
-        status_message = 'High server utilization'
-    elif utilization_rate >= 50:
-        cu_status = 'GOOD'
-        status_message = 'Normal server operation'
-    else:
-        cu_status = 'OPTIMAL'
-        status_message = 'Low server utilization'
+    # One tier lookup drives status, efficiency penalty and recommendation
+    cu_status, status_message, utilization_penalty, recommendation = CU_TIERS[
+        bisect_right(CU_TIER_THRESHOLDS, utilization_rate)
+    ]
     
     # Calculate efficiency metrics
-    efficiency_score = calculate_server_efficiency(utilization_rate, server_data)
-    
-    return {
-        'current_cu': current_cu,
-        'max_cu': max_cu,
-        'utilization_rate': utilization_rate,
-        'status': cu_status,
-        'status_message': status_message,
-        'efficiency_score': efficiency_score,
-        'recommended_actions': generate_cu_recommendations(utilization_rate, cu_status)
-    }
-
-def calculate_server_efficiency(utilization_rate: float, server_data: Dict[str, Any]) -> float:
-    """Calculate overall server efficiency score"""
-    
-    base_efficiency = 100
-    
-    # Penalize very high utilization (performance degradation)
-    if utilization_rate > 85:
-        base_efficiency -= (utilization_rate - 85) * 2
-    
-    # Penalize very low utilization (waste of resources)
-    elif utilization_rate < 30:
-        base_efficiency -= (30 - utilization_rate) * 0.5
+    efficiency_score = 100
+    if utilization_penalty is not None:
+        efficiency_score -= utilization_penalty(utilization_rate)
     
     # Factor in hardware quality
     hardware_components = server_data.get('hardware_components', [])
     if hardware_components:
         total_hardware = sum(comp['quantity'] for comp in hardware_components)
         if total_hardware < 5:  # Insufficient hardware
-            base_efficiency -= 20
-    
-    return max(base_efficiency, 0)
-
-def generate_cu_recommendations(utilization_rate: float, status: str) -> List[Dict[str, Any]]:
-    """Generate recommendations for CU optimization"""
-    
-    recommendations = []
-    
-    if status == 'CRITICAL':
-        recommendations.append({
-            'priority': 'URGENT',
-            'action': 'Add server capacity immediately',
-            'reason': f'CU utilization at {utilization_rate:.1f}% - risk of performance issues',
-            'task_type': 'Hardware Upgrade'
-        })
-    elif status == 'WARNING':
-        recommendations.append({
-            'priority': 'HIGH',
-            'action': 'Plan server capacity expansion',
-            'reason': f'CU utilization at {utilization_rate:.1f}% - approaching capacity limits',
-            'task_type': 'Capacity Planning'
-        })
-    elif utilization_rate < 30:
-        recommendations.append({
-            'priority': 'LOW',
-            'action': 'Optimize server configuration',
-            'reason': f'CU utilization at {utilization_rate:.1f}% - servers may be underutilized',
-            'task_type': 'Optimization'
+            efficiency_score -= 20
+    
+    recommended_actions = []
+    if recommendation is not None:
+        priority, action, reason, task_type = recommendation
+        recommended_actions.append({
+            'priority': priority,
+            'action': action,
+            'reason': f'CU utilization at {utilization_rate:.1f}% - {reason}',
+            'task_type': task_type
         })
     
-    return recommendations
+    return {
+        'current_cu': current_cu,
+        'max_cu': max_cu,
+        'utilization_rate': utilization_rate,
+        'status': cu_status,
+        'status_message': status_message,
+        'efficiency_score': max(efficiency_score, 0),
+        'recommended_actions': recommended_actions
+    }
 
 def assess_hardware_health(server_data: Dict[str, Any]) -> Dict[str, Any]:
     """Assess overall hardware health and maintenance needs"""
     
     hardware_components = server_data.get('hardware_components', [])
     
-    health_issues = []
     maintenance_priorities = []
     
-    # Check for component shortages
-    component_types = {}
-    for component in hardware_components:
-        comp_type = component['type']
-        if comp_type not in component_types:
-            component_types[comp_type] = 0
-        component_types[comp_type] += component['quantity']
-    
-    # Identify shortages
-    required_minimums = {
-        'Server Hardware': 3,
-        'Network Infrastructure': 2,
-        'Database Systems': 2,
-        'Security Systems': 1
+    # Check for component shortages: total quantity per hardware type
+    component_types = {
+        comp_type: sum(map(_component_quantity, group))
+        for comp_type, group in groupby(sorted(hardware_components, key=_component_type), key=_component_type)
     }
     
-    for comp_type, required in required_minimums.items():
-        current = component_types.get(comp_type, 0)
-        if current < required:
-            health_issues.append({
-                'type': 'SHORTAGE',
-                'component': comp_type,
-                'current': current,
-                'required': required,
-                'severity': 'HIGH' if current == 0 else 'MEDIUM'
-            })
+    # Identify shortages against the required minimums in one vectorized compare
+    current_counts = [component_types.get(comp_type, 0) for comp_type in REQUIRED_HARDWARE_TYPES]
+    shortage_indices = np.flatnonzero(np.array(current_counts) < REQUIRED_HARDWARE_MINIMUMS)
+    
+    health_issues = [
+        {
+            'type': 'SHORTAGE',
+            'component': REQUIRED_HARDWARE_TYPES[i],
+            'current': current_counts[i],
+            'required': int(REQUIRED_HARDWARE_MINIMUMS[i]),
+            'severity': 'HIGH' if current_counts[i] == 0 else 'MEDIUM'
+        }
+        for i in shortage_indices.tolist()
+    ]
     
     # Overall health score
-    total_issues = len(health_issues)
-    if total_issues == 0:
-        health_score = 100
-        health_status = 'EXCELLENT'
-    elif total_issues <= 2:
-        health_score = 75
-        health_status = 'GOOD'
-    elif total_issues <= 4:
-        health_score = 50
-        health_status = 'FAIR'
-    else:
-        health_score = 25
-        health_status = 'POOR'
+    health_score, health_status = HEALTH_LEVELS[bisect_left(HEALTH_ISSUE_THRESHOLDS, len(health_issues))]
     
     return {
         'health_score': health_score,
@@ -310,28 +338,23 @@ def generate_sysadmin_tasks(cu_analysis: Dict[str, Any], hardware_status: Dict[s
     
     return tasks
 
-def generate_performance_alerts(server_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+def generate_performance_alerts(server_data: Dict[str, Any], cu_analysis: Dict[str, Any]) -> List[Dict[str, Any]]:
     """Generate alerts for performance issues"""
     
     alerts = []
     
-    cu_usage = server_data['cu_usage']
-    max_cu = server_data['max_cu_capacity']
-    utilization = (cu_usage / max_cu) * 100 if max_cu > 0 else 0
+    cu_usage = cu_analysis['current_cu']
+    max_cu = cu_analysis['max_cu']
+    utilization = cu_analysis['utilization_rate']
     
-    if utilization >= 95:
-        alerts.append({
-            'level': 'CRITICAL',
-            'message': 'Server capacity at maximum - immediate action required',
-            'details': f'CU usage: {cu_usage}/{max_cu} ({utilization:.1f}%)',
-            'recommended_action': 'Add server capacity or optimize workloads immediately'
-        })
-    elif utilization >= 85:
+    capacity_alert = CAPACITY_ALERT_LEVELS[bisect_right(CAPACITY_ALERT_THRESHOLDS, utilization)]
+    if capacity_alert is not None:
+        level, message, recommended_action = capacity_alert
         alerts.append({
-            'level': 'WARNING',
-            'message': 'Server capacity approaching limits',
+            'level': level,
+            'message': message,
             'details': f'CU usage: {cu_usage}/{max_cu} ({utilization:.1f}%)',
-            'recommended_action': 'Plan capacity expansion or optimization'
+            'recommended_action': recommended_action
         })
     
     # Check for hardware shortages
@@ -387,6 +410,16 @@ def calculate_potential_savings(server_data: Dict[str, Any]) -> float:
 def calculate_optimization_roi(potential_savings: float, team_data: Dict[str, Any]) -> Dict[str, Any]:
     """Calculate ROI for hiring SysAdmin for optimization"""
     
+    # Nothing to recover - skip the team scan and report a zero ROI
+    if potential_savings <= 0:
+        return {
+            'sysadmin_monthly_cost': 0,
+            'annual_potential_savings': 0,
+            'net_annual_benefit': 0,
+            'roi_percentage': 0,
+            'payback_period_months': 0
+        }
+    
     # Find SysAdmin salary if exists
     sysadmin_salary = 0
     if 'team_members' in team_data:
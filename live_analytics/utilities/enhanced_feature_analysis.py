@@ -4,9 +4,23 @@ Provides real feature names, production planning, and team assignments
 """
 
 import json
+import re
+from collections import Counter, defaultdict
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
+import streamlit as st
+
+try:
+    from numba import njit, prange
+except ImportError:  # Optional dependency - fall back to the NumPy kernel
+    njit = None
+
+from utilities.live_file_sync import SAVE_HASH_FUNCS
+from utilities.save_records import flatten_inventory
+
 # Feature name mappings based on common Startup Company features
 FEATURE_NAME_MAPPINGS = {
     # Common patterns to identify features
@@ -31,17 +45,78 @@ FEATURE_NAME_MAPPINGS = {
     'admin': 'Admin Panel'
 }
 
+# One scan finds every mapping keyword in a description (lookahead keeps overlaps)
+_FEATURE_KEYWORD_PATTERN = re.compile(
+    '(?=(' + '|'.join(re.escape(keyword) for keyword in FEATURE_NAME_MAPPINGS) + '))'
+)
+_FEATURE_KEYWORD_PRIORITY = {keyword: i for i, keyword in enumerate(FEATURE_NAME_MAPPINGS)}
+
+# High priority components (blockers for multiple features)
+HIGH_PRIORITY_COMPONENTS = frozenset({'BackendComponent', 'FrontendModule', 'UiComponent'})
+
+# Medium priority (specialized but important)
+MEDIUM_PRIORITY_COMPONENTS = frozenset({'GraphicsComponent', 'BlueprintComponent', 'InterfaceModule'})
+
+# Feature x component matrices smaller than this stay on plain NumPy; JIT
+# dispatch and thread start-up only pay off on large saves
+NUMBA_MIN_CELLS = 10_000
+
+# Readiness score cut-offs: below 50 is blocked, below 100 is partially ready
+FEATURE_STATUS_THRESHOLDS = (50, 100)
+FEATURE_STATUS_NAMES = ('blocked', 'partially_ready', 'ready')
+FEATURE_SUMMARY_KEYS = ('blocked', 'partially_ready', 'ready_to_build')
+
+def _readiness_totals_numpy(needed: np.ndarray, available: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Per-feature needed/available totals and per-component shortages"""
+    total_needed = needed.sum(axis=1)
+    total_available = np.minimum(needed, available).sum(axis=1)
+    shortages = np.clip(needed - available, 0, None)
+    return total_needed, total_available, shortages
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _readiness_totals_jit(needed, available):
+        """Numba kernel equivalent of _readiness_totals_numpy, parallel over features"""
+        feature_count, component_count = needed.shape
+        total_needed = np.zeros(feature_count, np.int64)
+        total_available = np.zeros(feature_count, np.int64)
+        shortages = np.zeros((feature_count, component_count), np.int64)
+        for f in prange(feature_count):
+            for c in range(component_count):
+                n = needed[f, c]
+                a = available[c]
+                total_needed[f] += n
+                total_available[f] += min(n, a)
+                if a < n:
+                    shortages[f, c] = n - a
+        return total_needed, total_available, shortages
+else:
+    _readiness_totals_jit = None
+
+def _readiness_totals(needed: np.ndarray, available: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Use the JIT kernel for large matrices when Numba is installed, NumPy otherwise"""
+    if _readiness_totals_jit is not None and needed.size >= NUMBA_MIN_CELLS:
+        return _readiness_totals_jit(needed, available)
+    return _readiness_totals_numpy(needed, available)
+
 def identify_feature_name(feature_data: dict, feature_index: int) -> str:
     """Identify the real feature name from feature data"""
     
+    return _identify_feature_name(
+        feature_data.get('name', '').strip(),
+        frozenset(feature_data.get('requirements', {})),
+        feature_data.get('description', ''),
+        feature_index
+    )
+
+@lru_cache(maxsize=4096)
+def _identify_feature_name(explicit_name: str, requirements: frozenset, description: str, feature_index: int) -> str:
+    """Cached name inference keyed on the fields that determine the result"""
+    
     # Try to get explicit name first
-    explicit_name = feature_data.get('name', '').strip()
     if explicit_name and explicit_name != f'Feature_{feature_index}':
         return explicit_name
     
-    # Look at requirements to infer feature type
-    requirements = feature_data.get('requirements', {})
-    
     # Pattern matching based on requirements
     if 'VideoPlaybackModule' in requirements:
         return 'Video Functionality'
@@ -61,45 +136,45 @@ def identify_feature_name(feature_data: dict, feature_index: int) -> str:
     elif 'BackendModule' in requirements:
         return 'Backend Feature'
     
-    # Check feature description or other fields
-    description = feature_data.get('description', '').lower()
-    for keyword, name in FEATURE_NAME_MAPPINGS.items():
-        if keyword in description:
-            return name
+    # Check feature description or other fields; earlier mapping entries win
+    matched_keywords = _FEATURE_KEYWORD_PATTERN.findall(description.lower())
+    if matched_keywords:
+        return FEATURE_NAME_MAPPINGS[min(matched_keywords, key=_FEATURE_KEYWORD_PRIORITY.__getitem__)]
     
     # Fallback to generic name
     return f'Feature {feature_index + 1}'
 
+@st.cache_data(show_spinner=False, hash_funcs=SAVE_HASH_FUNCS)
 def analyze_production_queue(data: dict) -> Dict:
     """Analyze current production plans and queue status"""
     production_plans = data.get('productionPlans', [])
     
-    analysis = {
-        'active_plans': len(production_plans),
-        'planned_production': {},
-        'plan_details': [],
-        'completion_estimates': {}
-    }
+    planned_production = Counter()
+    plan_details = []
     
     for plan in production_plans:
-        plan_name = plan.get('name', 'Unnamed Plan')
-        production = plan.get('production', {})
+        production = plan.get('production', {}) or {}
         
-        plan_info = {
-            'name': plan_name,
+        # Aggregate planned production and this plan's total in the same walk
+        plan_total = 0
+        for component, count in production.items():
+            planned_production[component] += count
+            plan_total += count
+        
+        plan_details.append({
+            'name': plan.get('name', 'Unnamed Plan'),
             'id': plan.get('id', ''),
             'components': production,
-            'total_items': sum(production.values()) if production else 0,
+            'total_items': plan_total,
             'skip_missing': plan.get('skipModulesWithMissingRequirements', False)
-        }
-        
-        analysis['plan_details'].append(plan_info)
-        
-        # Aggregate planned production
-        for component, count in production.items():
-            analysis['planned_production'][component] = analysis['planned_production'].get(component, 0) + count
+        })
     
-    return analysis
+    return {
+        'active_plans': len(production_plans),
+        'planned_production': dict(planned_production),
+        'plan_details': plan_details,
+        'completion_estimates': {}
+    }
 
 def calculate_team_assignments(missing_components: Dict[str, int], employee_data: dict) -> Dict:
     """Calculate optimal team assignments for missing components"""
@@ -123,7 +198,7 @@ def calculate_team_assignments(missing_components: Dict[str, int], employee_data
     }
     
     assignments = {}
-    workload_summary = {}
+    workload_summary = defaultdict(lambda: {'components': 0, 'total_items': 0, 'estimated_days': 0})
     
     for component, needed_count in missing_components.items():
         if needed_count <= 0:
@@ -135,37 +210,29 @@ def calculate_team_assignments(missing_components: Dict[str, int], employee_data
             'component': component,
             'needed': needed_count,
             'assigned_role': required_role,
-            'priority': calculate_component_priority(component, missing_components),
+            'priority': calculate_component_priority(component),
             'estimated_days': estimate_development_time(component, needed_count)
         }
         
         # Track workload by role
-        if required_role not in workload_summary:
-            workload_summary[required_role] = {'components': 0, 'total_items': 0, 'estimated_days': 0}
-        
-        workload_summary[required_role]['components'] += 1
-        workload_summary[required_role]['total_items'] += needed_count
-        workload_summary[required_role]['estimated_days'] += assignments[component]['estimated_days']
+        role_workload = workload_summary[required_role]
+        role_workload['components'] += 1
+        role_workload['total_items'] += needed_count
+        role_workload['estimated_days'] += assignments[component]['estimated_days']
     
     return {
         'assignments': assignments,
-        'workload_by_role': workload_summary,
+        'workload_by_role': dict(workload_summary),
         'total_missing_components': sum(missing_components.values()),
         'roles_needed': len(workload_summary)
     }
 
-def calculate_component_priority(component: str, all_missing: Dict[str, int]) -> str:
+def calculate_component_priority(component: str) -> str:
     """Calculate priority level for component production"""
     
-    # High priority components (blockers for multiple features)
-    high_priority = ['BackendComponent', 'FrontendModule', 'UiComponent']
-    
-    # Medium priority (specialized but important)
-    medium_priority = ['GraphicsComponent', 'BlueprintComponent', 'InterfaceModule']
-    
-    if component in high_priority:
+    if component in HIGH_PRIORITY_COMPONENTS:
         return 'High'
-    elif component in medium_priority:
+    elif component in MEDIUM_PRIORITY_COMPONENTS:
         return 'Medium'
     else:
         return 'Low'
@@ -191,11 +258,12 @@ def estimate_development_time(component: str, count: int) -> int:
     base_time = base_times.get(component, 2)  # Default 2 days
     return base_time * count
 
+@st.cache_data(show_spinner=False, hash_funcs=SAVE_HASH_FUNCS)
 def get_comprehensive_feature_analysis(data: dict) -> Dict:
     """Get comprehensive analysis including names, production, and assignments"""
     
     feature_instances = data.get('featureInstances', [])
-    inventory = data.get('inventory', {})
+    inventory = flatten_inventory(data.get('inventory', {}))
     
     analysis = {
         'features': [],
@@ -210,57 +278,100 @@ def get_comprehensive_feature_analysis(data: dict) -> Dict:
         }
     }
     
-    # Analyze each feature
+    # Features built from the same template share an identical requirements
+    # dict, so collapse them to unique signatures and do the requirement-side
+    # work (matrix rows, readiness, shortages) once per signature
+    requirement_rows = [feature.get('requirements', {}) for feature in feature_instances]
+    signature_rows = {}
+    signature_of_feature = []
+    unique_requirements = []
+    for requirements in requirement_rows:
+        signature = tuple(requirements.items())
+        row = signature_rows.get(signature)
+        if row is None:
+            row = signature_rows[signature] = len(unique_requirements)
+            unique_requirements.append(requirements)
+        signature_of_feature.append(row)
+    
+    # Lay unique requirements out as a dense signature x component matrix so
+    # readiness and shortages are computed with array ops
+    component_index = {}
+    for requirements in unique_requirements:
+        for component in requirements:
+            component_index.setdefault(component, len(component_index))
+    
+    needed = np.zeros((len(unique_requirements), len(component_index)), dtype=np.int64)
+    for row, requirements in enumerate(unique_requirements):
+        for component, count in requirements.items():
+            needed[row, component_index[component]] = count
+    inventory_get = inventory.get
+    available = np.fromiter(
+        (inventory_get(component, 0) for component in component_index),
+        dtype=np.int64,
+        count=len(component_index)
+    )
+    
+    total_needed, total_available, shortages = _readiness_totals(needed, available)
+    readiness = np.where(
+        total_needed > 0,
+        total_available / np.maximum(total_needed, 1) * 100,
+        100.0
+    )
+    signature_buckets = np.digitize(readiness, FEATURE_STATUS_THRESHOLDS)
+    
+    # Shortage dicts per signature, only for rows that are short of something
+    column_of = component_index.__getitem__
+    signature_missing = []
+    for row, (requirements, short) in enumerate(zip(unique_requirements, shortages.any(axis=1).tolist())):
+        if not short:
+            signature_missing.append({})
+            continue
+        row_shortages = shortages[row].tolist()
+        signature_missing.append({
+            component: shortage
+            for component, shortage in (
+                (component, row_shortages[column_of(component)])
+                for component in requirements
+            )
+            if shortage > 0
+        })
+    
+    # Fan signature results back out to features. Arrays become Python lists
+    # and hot lookups become locals up front, so the loop body avoids NumPy
+    # scalar boxing and repeated attribute access.
+    global_missing = Counter()
+    update_global_missing = global_missing.update
+    append_feature = analysis['features'].append
+    status_names = FEATURE_STATUS_NAMES
+    readiness_scores = readiness.tolist()
+    status_indices = signature_buckets.tolist()
+    
     for i, feature in enumerate(feature_instances):
-        feature_name = identify_feature_name(feature, i)
-        requirements = feature.get('requirements', {})
+        row = signature_of_feature[i]
+        feature_missing = dict(signature_missing[row])
+        if feature_missing:
+            # Add to global missing components
+            update_global_missing(feature_missing)
         
         feature_analysis = {
             'id': i,
-            'name': feature_name,
+            'name': identify_feature_name(feature, i),
             'original_name': feature.get('name', f'Feature_{i}'),
-            'requirements': requirements,
-            'missing_components': {},
-            'status': 'unknown',
-            'readiness_score': 0,
-            'blocking_components': []
+            'requirements': requirement_rows[i],
+            'missing_components': feature_missing,
+            'status': status_names[status_indices[row]],
+            'readiness_score': readiness_scores[row],
+            'blocking_components': list(feature_missing)
         }
         
-        # Check component availability
-        total_needed = 0
-        total_available = 0
-        
-        for component, needed in requirements.items():
-            available = inventory.get(component, 0)
-            total_needed += needed
-            total_available += min(available, needed)
-            
-            if available < needed:
-                shortage = needed - available
-                feature_analysis['missing_components'][component] = shortage
-                feature_analysis['blocking_components'].append(component)
-                
-                # Add to global missing components
-                analysis['missing_components'][component] = analysis['missing_components'].get(component, 0) + shortage
-        
-        # Calculate readiness
-        if total_needed > 0:
-            feature_analysis['readiness_score'] = (total_available / total_needed) * 100
-        else:
-            feature_analysis['readiness_score'] = 100
-            
-        # Determine status
-        if feature_analysis['readiness_score'] >= 100:
-            feature_analysis['status'] = 'ready'
-            analysis['feature_summary']['ready_to_build'] += 1
-        elif feature_analysis['readiness_score'] >= 50:
-            feature_analysis['status'] = 'partially_ready'
-            analysis['feature_summary']['partially_ready'] += 1
-        else:
-            feature_analysis['status'] = 'blocked'
-            analysis['feature_summary']['blocked'] += 1
-        
-        analysis['features'].append(feature_analysis)
+        append_feature(feature_analysis)
+    
+    analysis['missing_components'] = dict(global_missing)
+    
+    # Tally statuses once from the bucket indices
+    status_buckets = signature_buckets[np.asarray(signature_of_feature, dtype=np.intp)]
+    status_counts = np.bincount(status_buckets, minlength=len(FEATURE_STATUS_NAMES)).tolist()
+    analysis['feature_summary'].update(zip(FEATURE_SUMMARY_KEYS, status_counts))
     
     # Calculate team assignments for missing components
     analysis['team_assignments'] = calculate_team_assignments(
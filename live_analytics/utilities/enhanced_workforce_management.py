@@ -4,74 +4,202 @@ Handles sales executives, researchers, and developer teams with specialized work
 """
 
 import json
+from bisect import bisect_right
 from datetime import datetime, timedelta
+from functools import partial
+from itertools import chain
+from dataclasses import dataclass
 from typing import Dict, List, Any, Tuple
+import numpy as np
 import streamlit as st
 
-def analyze_sales_team(data: Dict[str, Any]) -> Dict[str, Any]:
+try:
+    from numba import njit
+except ImportError:  # Optional dependency - fall back to the NumPy ranking
+    njit = None
+
+from utilities.live_file_sync import SAVE_HASH_FUNCS
+from utilities.save_records import extract_skills
+
+DEV_TEAM_TYPES = ('Developer', 'Designer', 'LeadDeveloper')
+
+@dataclass(slots=True)
+class LeadAnalysis:
+    """A sales lead with its impression-based priority"""
+    id: str
+    short_id: str
+    impressions: float
+    priority: str
+    urgency: str
+    timestamp: str
+    competitor_id: str
+
+@dataclass(slots=True)
+class SalesExecutive:
+    """A sales executive's profile and ranked lead portfolio"""
+    name: str
+    level: str
+    speed: float
+    salary: int
+    workstation: int
+    total_leads: int
+    leads: List[LeadAnalysis]
+    capacity: str
+    current_task: Dict[str, Any]
+    mood: float
+
+@dataclass(slots=True)
+class Researcher:
+    """A researcher's profile and training assessment"""
+    name: str
+    level: str
+    speed: float
+    salary: int
+    workstation: int
+    research_skill: float
+    current_task: Dict[str, Any]
+    mood: float
+    training_opportunity: Dict[str, Any]
+
+@dataclass(slots=True)
+class DevTeamMember:
+    """A developer, designer or lead developer with skills and training assessment"""
+    name: str
+    type: str
+    level: str
+    speed: float
+    salary: int
+    workstation: int
+    skills: Dict[str, float]
+    training_opportunities: Dict[str, Any]
+    current_assignment: Dict[str, Any]
+    mood: float
+
+# Priority tokens shared by every recommendation and training record
+HIGH = 'HIGH'
+MEDIUM = 'MEDIUM'
+LOW = 'LOW'
+
+# Lead impression cut-offs; bisect_right index selects priority and urgency
+LEAD_IMPRESSION_THRESHOLDS = (150000, 200000)
+LEAD_PRIORITIES = (LOW, MEDIUM, HIGH)
+LEAD_URGENCY = ('Lower value', 'Good potential', 'High value opportunity')
+LEAD_HIGH_RANK = LEAD_PRIORITIES.index(HIGH)
+# Lead lists at least this long are ranked with NumPy instead of per-lead bisects
+LEAD_VECTORIZE_MIN = 16
+# Teams larger than this have their speed totals reduced with NumPy
+TEAM_VECTORIZE_MIN = 16
+
+_EMPTY_OFFICE = {}
+
+def _workstations(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """The office workstation list, or an empty tuple without allocating defaults"""
+    return data.get('office', _EMPTY_OFFICE).get('workstations', ())
+
+def _bucket_employees(data: Dict[str, Any]) -> Dict[str, List[Tuple[int, Dict[str, Any]]]]:
+    """Group staffed workstations by employee type as (workstation index, employee) pairs"""
+    
+    buckets = {}
+    for i, workstation in enumerate(_workstations(data)):
+        emp = workstation.get('employee')
+        if emp:
+            buckets.setdefault(emp.get('employeeTypeName'), []).append((i, emp))
+    return buckets
+
+_LEAD_THRESHOLD_ARRAY = np.array(LEAD_IMPRESSION_THRESHOLDS, dtype=np.float64)
+
+def _rank_impressions(impressions: np.ndarray, thresholds: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Rank kernel: count the thresholds each impression meets, then order HIGH-first (stable)"""
+    ranks = np.zeros(impressions.size, np.int64)
+    for k in range(impressions.size):
+        rank = 0
+        for threshold in thresholds:
+            if impressions[k] >= threshold:
+                rank += 1
+        ranks[k] = rank
+    return ranks, np.argsort(-ranks, kind='mergesort')
+
+# Compiled once per machine thanks to cache=True; NumPy handles ranking without Numba
+_rank_impressions_jit = njit(cache=True)(_rank_impressions) if njit is not None else None
+
+def _rank_leads(leads: List[Dict[str, Any]]) -> Tuple[List[int], List[int]]:
+    """Priority rank of each lead and the HIGH-first order to list them in"""
+    
+    if len(leads) < LEAD_VECTORIZE_MIN:
+        ranks = [bisect_right(LEAD_IMPRESSION_THRESHOLDS, lead.get('impressions', 0)) for lead in leads]
+        return ranks, sorted(range(len(ranks)), key=ranks.__getitem__, reverse=True)
+    
+    impressions = np.fromiter(
+        (lead.get('impressions', 0) for lead in leads), dtype=np.float64, count=len(leads)
+    )
+    if _rank_impressions_jit is not None:
+        ranks, order = _rank_impressions_jit(impressions, _LEAD_THRESHOLD_ARRAY)
+    else:
+        ranks = np.searchsorted(_LEAD_THRESHOLD_ARRAY, impressions, side='right')
+        order = np.argsort(-ranks, kind='stable')
+    return ranks.tolist(), order.tolist()
+
+def _total_speed(speeds: List[float]) -> float:
+    """Sum of team speeds, reduced in NumPy once the team is large"""
+    if len(speeds) <= TEAM_VECTORIZE_MIN:
+        return sum(speeds)
+    return np.fromiter(speeds, dtype=np.float64, count=len(speeds)).sum().item()
+
+# Callers that only need the profiles pass build_recommendations=False
+@st.cache_data(show_spinner=False, hash_funcs=SAVE_HASH_FUNCS)
+def analyze_sales_team(data: Dict[str, Any], _employees_by_type: Dict[str, List] = None,
+                       build_recommendations: bool = True) -> Dict[str, Any]:
     """Analyze sales team performance and lead management strategy"""
     
-    workstations = data.get('office', {}).get('workstations', [])
+    employees_by_type = _employees_by_type if _employees_by_type is not None else _bucket_employees(data)
     sales_executives = []
-    
-    # Find all sales executives
-    for i, workstation in enumerate(workstations):
-        if 'employee' in workstation and workstation['employee']:
-            emp = workstation['employee']
-            if emp.get('employeeTypeName') == 'SalesExecutive':
-                
-                leads = emp.get('leads', [])
-                lead_analysis = []
-                
-                # Analyze each lead
-                for lead in leads:
-                    impressions = lead.get('impressions', 0)
-                    timestamp = lead.get('timestamp', '')
-                    competitor_id = lead.get('competitorProductId', '')
-                    
-                    # Determine lead priority based on impressions
-                    if impressions >= 200000:
-                        priority = 'HIGH'
-                        urgency = 'High value opportunity'
-                    elif impressions >= 150000:
-                        priority = 'MEDIUM'
-                        urgency = 'Good potential'
-                    else:
-                        priority = 'LOW'
-                        urgency = 'Lower value'
-                    
-                    lead_analysis.append({
-                        'id': lead.get('id', 'unknown'),
-                        'impressions': impressions,
-                        'priority': priority,
-                        'urgency': urgency,
-                        'timestamp': timestamp,
-                        'competitor_id': competitor_id
-                    })
-                
-                # Sort leads by priority (HIGH first)
-                lead_analysis.sort(key=lambda x: {'HIGH': 3, 'MEDIUM': 2, 'LOW': 1}[x['priority']], reverse=True)
-                
-                sales_exec_data = {
-                    'name': emp.get('name', 'Unknown'),
-                    'level': emp.get('level', 'Unknown'),
-                    'speed': emp.get('speed', 0),
-                    'salary': emp.get('salary', 0),
-                    'workstation': i,
-                    'total_leads': len(leads),
-                    'leads': lead_analysis,
-                    'capacity': determine_sales_capacity(emp),
-                    'current_task': emp.get('task', {}),
-                    'mood': emp.get('mood', 50)
-                }
-                
-                sales_executives.append(sales_exec_data)
+    total_leads = 0
+    high_priority_leads = 0
+    
+    # Analyze each sales executive
+    for i, emp in employees_by_type.get('SalesExecutive', ()):
+        get = emp.get
+        leads = get('leads', [])
+        ranks, order = _rank_leads(leads)
+        total_leads += len(leads)
+        high_priority_leads += ranks.count(LEAD_HIGH_RANK)
+        
+        # Analyze each lead, HIGH priority first
+        lead_analysis = []
+        for j in order:
+            lead_get = leads[j].get
+            rank = ranks[j]
+            lead_id = lead_get('id', 'unknown')
+            lead_analysis.append(LeadAnalysis(
+                id=lead_id,
+                short_id=lead_id[:8],
+                impressions=lead_get('impressions', 0),
+                priority=LEAD_PRIORITIES[rank],
+                urgency=LEAD_URGENCY[rank],
+                timestamp=lead_get('timestamp', ''),
+                competitor_id=lead_get('competitorProductId', '')
+            ))
+        
+        sales_exec_data = SalesExecutive(
+            name=get('name', 'Unknown'),
+            level=get('level', 'Unknown'),
+            speed=get('speed', 0),
+            salary=get('salary', 0),
+            workstation=i,
+            total_leads=len(leads),
+            leads=lead_analysis,
+            capacity=determine_sales_capacity(emp),
+            current_task=get('task', {}),
+            mood=get('mood', 50)
+        )
+        
+        sales_executives.append(sales_exec_data)
     
     return {
         'sales_executives': sales_executives,
-        'total_leads': sum(exec['total_leads'] for exec in sales_executives),
-        'high_priority_leads': sum(1 for exec in sales_executives for lead in exec['leads'] if lead['priority'] == 'HIGH'),
-        'recommendations': generate_sales_strategy(sales_executives)
+        'total_leads': total_leads,
+        'high_priority_leads': high_priority_leads,
+        'recommendations': generate_sales_strategy(sales_executives) if build_recommendations else []
     }
 
 def determine_sales_capacity(sales_exec: Dict[str, Any]) -> str:
@@ -86,20 +214,20 @@ def determine_sales_capacity(sales_exec: Dict[str, Any]) -> str:
     else:
         return 'Can handle 1-2 leads (recommended: 1 at a time)'
 
-def generate_sales_strategy(sales_executives: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def generate_sales_strategy(sales_executives: List[SalesExecutive]) -> List[Dict[str, Any]]:
     """Generate strategic recommendations for sales team management"""
     
     recommendations = []
     
     for exec_data in sales_executives:
-        name = exec_data['name']
-        leads = exec_data['leads']
-        level = exec_data['level']
+        name = exec_data.name
+        leads = exec_data.leads
+        level = exec_data.level
         
         if not leads:
             recommendations.append({
                 'type': 'NO_LEADS',
-                'priority': 'MEDIUM',
+                'priority': MEDIUM,
                 'executive': name,
                 'message': f'{name} has no active leads. Consider prospecting or lead generation.',
                 'action': 'Assign lead generation tasks or review lead filters'
@@ -111,21 +239,21 @@ def generate_sales_strategy(sales_executives: List[Dict[str, Any]]) -> List[Dict
             highest_priority = leads[0]  # Already sorted by priority
             recommendations.append({
                 'type': 'CAPACITY_OPTIMIZATION',
-                'priority': 'HIGH',
+                'priority': HIGH,
                 'executive': name,
                 'data_point': f'Beginner-level executive with {len(leads)} concurrent leads',
                 'threshold': 'Beginner executives should handle ≤1 lead for optimal performance',
-                'game_action': f'Remove all leads except {highest_priority["id"][:8]}... from {name}\'s queue',
+                'game_action': f'Remove all leads except {highest_priority.short_id}... from {name}\'s queue',
                 'metric_impact': f'Expected improvement: +25% conversion rate on primary lead'
             })
         
         # Lead quantity analysis
-        high_value_leads = [lead for lead in leads if lead['priority'] == 'HIGH']
+        high_value_leads = [lead for lead in leads if lead.priority == HIGH]
         if len(high_value_leads) > 1:
-            total_value = sum(lead['impressions'] for lead in high_value_leads)
+            total_value = sum(lead.impressions for lead in high_value_leads)
             recommendations.append({
                 'type': 'LEAD_PRIORITIZATION',
-                'priority': 'HIGH', 
+                'priority': HIGH, 
                 'executive': name,
                 'data_point': f'{len(high_value_leads)} high-value leads totaling {total_value:,} impressions',
                 'threshold': 'Multiple high-value leads require sequential processing',
@@ -135,53 +263,58 @@ def generate_sales_strategy(sales_executives: List[Dict[str, Any]]) -> List[Dict
         
         # High-value lead analysis
         for lead in leads[:2]:  # Check top 2 leads
-            if lead['impressions'] >= 200000:
+            if lead.impressions >= 200000:
                 recommendations.append({
                     'type': 'HIGH_VALUE_TRIGGER',
-                    'priority': 'HIGH',
+                    'priority': HIGH,
                     'executive': name,
-                    'data_point': f'Lead value: {lead["impressions"]:,} impressions',
+                    'data_point': f'Lead value: {lead.impressions:,} impressions',
                     'threshold': 'Leads ≥200k impressions qualify for premium treatment',
-                    'game_action': f'Expedite contact and negotiation for lead {lead["id"][:8]}...',
+                    'game_action': f'Expedite contact and negotiation for lead {lead.short_id}...',
                     'metric_impact': 'Premium leads have 40% higher conversion probability'
                 })
     
     return recommendations
 
-def analyze_research_team(data: Dict[str, Any]) -> Dict[str, Any]:
+@st.cache_data(show_spinner=False, hash_funcs=SAVE_HASH_FUNCS)
+def analyze_research_team(data: Dict[str, Any], _employees_by_type: Dict[str, List] = None,
+                          build_recommendations: bool = True) -> Dict[str, Any]:
     """Analyze research team and ongoing research projects"""
     
-    workstations = data.get('office', {}).get('workstations', [])
+    employees_by_type = _employees_by_type if _employees_by_type is not None else _bucket_employees(data)
     researchers = []
-    
-    # Find all researchers
-    for i, workstation in enumerate(workstations):
-        if 'employee' in workstation and workstation['employee']:
-            emp = workstation['employee']
-            if emp.get('employeeTypeName') == 'Researcher':
-                
-                researcher_data = {
-                    'name': emp.get('name', 'Unknown'),
-                    'level': emp.get('level', 'Unknown'),
-                    'speed': emp.get('speed', 0),
-                    'salary': emp.get('salary', 0),
-                    'workstation': i,
-                    'research_skill': emp.get('researchSkill', 0),
-                    'current_task': emp.get('task', {}),
-                    'mood': emp.get('mood', 50),
-                    'training_opportunity': assess_researcher_training(emp)
-                }
-                
-                researchers.append(researcher_data)
+    speeds = []
+    
+    # Profile each researcher
+    for i, emp in employees_by_type.get('Researcher', ()):
+        get = emp.get
+        speed = get('speed', 0)
+        speeds.append(speed)
+        researcher_data = Researcher(
+            name=get('name', 'Unknown'),
+            level=get('level', 'Unknown'),
+            speed=speed,
+            salary=get('salary', 0),
+            workstation=i,
+            research_skill=get('researchSkill', 0),
+            current_task=get('task', {}),
+            mood=get('mood', 50),
+            training_opportunity=assess_researcher_training(emp)
+        )
+        
+        researchers.append(researcher_data)
     
     # Analyze research progress
     research_progress = analyze_research_progress(data)
+    total_capacity = _total_speed(speeds)
     
     return {
         'researchers': researchers,
         'research_progress': research_progress,
-        'total_research_capacity': sum(r['speed'] for r in researchers),
-        'recommendations': generate_research_strategy(researchers, research_progress)
+        'total_research_capacity': total_capacity,
+        'recommendations': (
+            generate_research_strategy(researchers, research_progress, total_capacity) if build_recommendations else []
+        )
     }
 
 def assess_researcher_training(researcher: Dict[str, Any]) -> Dict[str, Any]:
@@ -198,7 +331,7 @@ def assess_researcher_training(researcher: Dict[str, Any]) -> Dict[str, Any]:
             'type': 'RESEARCH_SKILL',
             'current': research_skill,
             'target': min(research_skill + 20, 100),
-            'priority': 'HIGH' if research_skill < 60 else 'MEDIUM'
+            'priority': HIGH if research_skill < 60 else MEDIUM
         })
     
     if speed < 150:
@@ -206,7 +339,7 @@ def assess_researcher_training(researcher: Dict[str, Any]) -> Dict[str, Any]:
             'type': 'SPEED',
             'current': speed,
             'target': min(speed + 30, 200),
-            'priority': 'MEDIUM'
+            'priority': MEDIUM
         })
     
     if level == 'Beginner' and research_skill > 70:
@@ -214,7 +347,7 @@ def assess_researcher_training(researcher: Dict[str, Any]) -> Dict[str, Any]:
             'type': 'LEVEL_ADVANCEMENT',
             'current': level,
             'target': 'Intermediate',
-            'priority': 'HIGH'
+            'priority': HIGH
         })
     
     return {
@@ -238,23 +371,24 @@ def analyze_research_progress(data: Dict[str, Any]) -> Dict[str, Any]:
         'recent_completions': researched_items[-5:] if len(researched_items) > 5 else researched_items
     }
 
-def generate_research_strategy(researchers: List[Dict[str, Any]], research_progress: Dict[str, Any]) -> List[Dict[str, Any]]:
+def generate_research_strategy(researchers: List[Researcher], research_progress: Dict[str, Any],
+                               total_capacity: float = None) -> List[Dict[str, Any]]:
     """Generate strategic recommendations for research team"""
     
     recommendations = []
     
     for researcher in researchers:
-        name = researcher['name']
-        training = researcher['training_opportunity']
+        name = researcher.name
+        training = researcher.training_opportunity
         
         # Training recommendations
         if training['has_opportunities']:
-            high_priority_training = [t for t in training['training_needs'] if t['priority'] == 'HIGH']
+            high_priority_training = [t for t in training['training_needs'] if t['priority'] == HIGH]
             
             if high_priority_training:
                 recommendations.append({
                     'type': 'TRAINING_NEEDED',
-                    'priority': 'HIGH',
+                    'priority': HIGH,
                     'researcher': name,
                     'message': f'{name} needs skill development training',
                     'action': f'Schedule training for: {", ".join([t["type"] for t in high_priority_training])}',
@@ -262,21 +396,22 @@ def generate_research_strategy(researchers: List[Dict[str, Any]], research_progr
                 })
         
         # Utilization optimization
-        if researcher['speed'] > 180:
+        if researcher.speed > 180:
             recommendations.append({
                 'type': 'HIGH_PERFORMER',
-                'priority': 'MEDIUM',
+                'priority': MEDIUM,
                 'researcher': name,
-                'message': f'{name} is a high performer (Speed: {researcher["speed"]:.0f})',
+                'message': f'{name} is a high performer (Speed: {researcher.speed:.0f})',
                 'action': 'Consider assigning to high-priority research projects'
             })
     
     # Team-level recommendations
-    total_capacity = sum(r['speed'] for r in researchers)
+    if total_capacity is None:
+        total_capacity = _total_speed([r.speed for r in researchers])
     if total_capacity < 300:  # Arbitrary threshold
         recommendations.append({
             'type': 'CAPACITY_SHORTAGE',
-            'priority': 'MEDIUM',
+            'priority': MEDIUM,
             'researcher': 'TEAM',
             'message': f'Research team capacity is low ({total_capacity:.0f})',
             'action': 'Consider hiring additional researchers or training existing team'
@@ -284,56 +419,46 @@ def generate_research_strategy(researchers: List[Dict[str, Any]], research_progr
     
     return recommendations
 
-def analyze_developer_teams(data: Dict[str, Any]) -> Dict[str, Any]:
+@st.cache_data(show_spinner=False, hash_funcs=SAVE_HASH_FUNCS)
+def analyze_developer_teams(data: Dict[str, Any], _employees_by_type: Dict[str, List] = None,
+                            build_recommendations: bool = True) -> Dict[str, Any]:
     """Enhanced analysis of developer teams with training opportunities"""
     
-    workstations = data.get('office', {}).get('workstations', [])
-    developers = []
-    designers = []
-    lead_developers = []
+    employees_by_type = _employees_by_type if _employees_by_type is not None else _bucket_employees(data)
+    teams = {}
     
-    # Categorize development team members
-    for i, workstation in enumerate(workstations):
-        if 'employee' in workstation and workstation['employee']:
-            emp = workstation['employee']
-            emp_type = emp.get('employeeTypeName', '')
+    # Profile development team members, one list per role
+    for emp_type in DEV_TEAM_TYPES:
+        team = teams[emp_type] = []
+        for i, emp in employees_by_type.get(emp_type, ()):
+            get = emp.get
             
-            if emp_type in ['Developer', 'Designer', 'LeadDeveloper']:
-                
-                # Extract skills
-                skills = {}
-                for key, value in emp.items():
-                    if 'skill' in key.lower() and isinstance(value, (int, float)):
-                        skills[key] = value
-                
-                # Assess training opportunities
-                training_assessment = assess_developer_training(emp, skills)
-                
-                dev_data = {
-                    'name': emp.get('name', 'Unknown'),
-                    'type': emp_type,
-                    'level': emp.get('level', 'Unknown'),
-                    'speed': emp.get('speed', 0),
-                    'salary': emp.get('salary', 0),
-                    'workstation': i,
-                    'skills': skills,
-                    'training_opportunities': training_assessment,
-                    'current_assignment': emp.get('task', {}),
-                    'mood': emp.get('mood', 50)
-                }
-                
-                if emp_type == 'Developer':
-                    developers.append(dev_data)
-                elif emp_type == 'Designer':
-                    designers.append(dev_data)
-                elif emp_type == 'LeadDeveloper':
-                    lead_developers.append(dev_data)
+            # Extract skills and assess training opportunities
+            skills = extract_skills(emp)
+            training_assessment = assess_developer_training(emp, skills)
+            
+            team.append(DevTeamMember(
+                name=get('name', 'Unknown'),
+                type=emp_type,
+                level=get('level', 'Unknown'),
+                speed=get('speed', 0),
+                salary=get('salary', 0),
+                workstation=i,
+                skills=skills,
+                training_opportunities=training_assessment,
+                current_assignment=get('task', {}),
+                mood=get('mood', 50)
+            ))
+    
+    developers, designers, lead_developers = (teams[emp_type] for emp_type in DEV_TEAM_TYPES)
     
     return {
         'developers': developers,
         'designers': designers,
         'lead_developers': lead_developers,
-        'team_recommendations': generate_dev_team_strategy(developers, designers, lead_developers)
+        'team_recommendations': (
+            generate_dev_team_strategy(developers, designers, lead_developers) if build_recommendations else []
+        )
     }
 
 def assess_developer_training(employee: Dict[str, Any], skills: Dict[str, Any]) -> Dict[str, Any]:
@@ -343,20 +468,26 @@ def assess_developer_training(employee: Dict[str, Any], skills: Dict[str, Any])
         return {'has_opportunities': False, 'training_needs': []}
     
     training_needs = []
-    max_skill = max(skills.values()) if skills else 0
-    avg_skill = sum(skills.values()) / len(skills) if skills else 0
+    
+    # One pass for the skill total and the first skill holding the top value
+    primary_skill, max_skill = next(iter(skills.items()))
+    total_skill = 0
+    for skill, value in skills.items():
+        total_skill += value
+        if value > max_skill:
+            primary_skill, max_skill = skill, value
+    avg_skill = total_skill / len(skills)
     speed = employee.get('speed', 0)
     level = employee.get('level', 'Beginner')
     
     # Primary skill improvement
     if max_skill < 80:
-        primary_skill = max(skills.keys(), key=lambda k: skills[k])
         training_needs.append({
             'type': 'PRIMARY_SKILL',
             'skill': primary_skill,
-            'current': skills[primary_skill],
-            'target': min(skills[primary_skill] + 20, 100),
-            'priority': 'HIGH' if max_skill < 60 else 'MEDIUM'
+            'current': max_skill,
+            'target': min(max_skill + 20, 100),
+            'priority': HIGH if max_skill < 60 else MEDIUM
         })
     
     # Cross-training opportunities
@@ -366,7 +497,7 @@ def assess_developer_training(employee: Dict[str, Any], skills: Dict[str, Any])
             training_needs.append({
                 'type': 'CROSS_TRAINING',
                 'skills': low_skills,
-                'priority': 'MEDIUM'
+                'priority': MEDIUM
             })
     
     # Speed training
@@ -375,7 +506,7 @@ def assess_developer_training(employee: Dict[str, Any], skills: Dict[str, Any])
             'type': 'SPEED_TRAINING',
             'current': speed,
             'target': min(speed + 30, 150),
-            'priority': 'HIGH' if speed < 80 else 'MEDIUM'
+            'priority': HIGH if speed < 80 else MEDIUM
         })
     
     # Level advancement
@@ -384,7 +515,7 @@ def assess_developer_training(employee: Dict[str, Any], skills: Dict[str, Any])
             'type': 'LEVEL_ADVANCEMENT',
             'current': level,
             'target': 'Intermediate',
-            'priority': 'HIGH'
+            'priority': HIGH
         })
     
     return {
@@ -405,40 +536,35 @@ def suggest_training_timing(employee: Dict[str, Any]) -> str:
     # This would need more game logic to determine project completion timing
     return "END_OF_SPRINT - Schedule after current assignment completion"
 
-def generate_dev_team_strategy(developers: List[Dict], designers: List[Dict], lead_developers: List[Dict]) -> List[Dict[str, Any]]:
+def generate_dev_team_strategy(developers: List[DevTeamMember], designers: List[DevTeamMember], lead_developers: List[DevTeamMember]) -> List[Dict[str, Any]]:
     """Generate development team strategy recommendations"""
     
     recommendations = []
     
     # Analyze each team member for training opportunities
-    all_team_members = developers + designers + lead_developers
-    
     high_priority_training = []
     medium_priority_training = []
     
-    for member in all_team_members:
-        if member['training_opportunities']['has_opportunities']:
-            training_needs = member['training_opportunities']['training_needs']
+    for member in chain(developers, designers, lead_developers):
+        if member.training_opportunities['has_opportunities']:
+            training_needs = member.training_opportunities['training_needs']
             
             for need in training_needs:
                 training_rec = {
-                    'employee': member['name'],
-                    'type': member['type'],
+                    'employee': member.name,
+                    'type': member.type,
                     'training_type': need['type'],
                     'priority': need['priority'],
-                    'timing': member['training_opportunities']['optimal_timing']
+                    'timing': member.training_opportunities['optimal_timing']
                 }
                 
-                if need['priority'] == 'HIGH':
-                    high_priority_training.append(training_rec)
-                else:
-                    medium_priority_training.append(training_rec)
+                (high_priority_training if need['priority'] == HIGH else medium_priority_training).append(training_rec)
     
     # High priority training recommendations
     if high_priority_training:
         recommendations.append({
             'type': 'URGENT_TRAINING',
-            'priority': 'HIGH',
+            'priority': HIGH,
             'message': f'{len(high_priority_training)} team members need urgent training',
             'action': 'Schedule training sessions for skill gaps and performance issues',
             'training_list': high_priority_training
@@ -448,7 +574,7 @@ def generate_dev_team_strategy(developers: List[Dict], designers: List[Dict], le
     if medium_priority_training:
         recommendations.append({
             'type': 'DEVELOPMENT_OPPORTUNITIES',
-            'priority': 'MEDIUM',
+            'priority': MEDIUM,
             'message': f'{len(medium_priority_training)} team members have development opportunities',
             'action': 'Plan training during project downtime or sprint breaks',
             'training_list': medium_priority_training
@@ -462,7 +588,7 @@ def generate_dev_team_strategy(developers: List[Dict], designers: List[Dict], le
     if total_devs < 2:
         recommendations.append({
             'type': 'TEAM_IMBALANCE',
-            'priority': 'MEDIUM',
+            'priority': MEDIUM,
             'message': 'Development team may be understaffed',
             'action': 'Consider hiring additional developers'
         })
@@ -470,101 +596,115 @@ def generate_dev_team_strategy(developers: List[Dict], designers: List[Dict], le
     if total_designers < 1 and total_devs > 2:
         recommendations.append({
             'type': 'DESIGN_BOTTLENECK',
-            'priority': 'HIGH',
+            'priority': HIGH,
             'message': 'Design capacity may be a bottleneck',
             'action': 'Consider hiring designers or cross-training developers'
         })
     
     return recommendations
 
-def generate_professional_development_plan(data: Dict[str, Any]) -> Dict[str, Any]:
-    """Generate comprehensive professional development plan for all employees"""
+def _training_record(employee: str, employee_type: str, training_need: str, priority: str,
+                     duration: str, outcome: str) -> Dict[str, Any]:
+    """One entry of the development plan"""
+    
+    return {
+        'employee': employee,
+        'type': employee_type,
+        'training_need': training_need,
+        'priority': priority,
+        'estimated_duration': duration,
+        'expected_outcome': outcome
+    }
+
+def _research_training_record(name: str, need: Dict[str, Any]) -> Dict[str, Any]:
+    """Development plan entry for one researcher skill gap"""
+    
+    return _training_record(name, 'Researcher', need['type'], need['priority'], '2-3 weeks',
+                            f"Improve {need['type']} from {need['current']} to {need['target']}")
+
+def _training_opportunities(data: Dict[str, Any]):
+    """Yield (priority, record_factory) for every training need in the office
     
-    # Analyze all employee types
-    sales_analysis = analyze_sales_team(data)
-    research_analysis = analyze_research_team(data)
-    dev_analysis = analyze_developer_teams(data)
+    The plan calls each factory to build its record; the summary only counts priorities.
+    """
     
-    # Consolidate all training opportunities
-    all_training_opportunities = []
+    # Analyze all employee types from a single pass over the workstations;
+    # only training needs are used here, so skip the team recommendations
+    employees_by_type = _bucket_employees(data)
+    sales_analysis = analyze_sales_team(data, employees_by_type, build_recommendations=False)
+    research_analysis = analyze_research_team(data, employees_by_type, build_recommendations=False)
+    dev_analysis = analyze_developer_teams(data, employees_by_type, build_recommendations=False)
     
     # Sales team training
     for exec_data in sales_analysis['sales_executives']:
-        if exec_data.get('level') == 'Beginner':
-            all_training_opportunities.append({
-                'employee': exec_data['name'],
-                'type': 'SalesExecutive',
-                'training_need': 'Sales negotiation and lead management',
-                'priority': 'HIGH',
-                'estimated_duration': '2 weeks',
-                'expected_outcome': 'Improved close rate and lead handling capacity'
-            })
+        if exec_data.level == 'Beginner':
+            yield HIGH, partial(_training_record, exec_data.name, 'SalesExecutive',
+                                'Sales negotiation and lead management', HIGH, '2 weeks',
+                                'Improved close rate and lead handling capacity')
     
     # Research team training
     for researcher in research_analysis['researchers']:
-        if researcher['training_opportunity']['has_opportunities']:
-            for need in researcher['training_opportunity']['training_needs']:
-                all_training_opportunities.append({
-                    'employee': researcher['name'],
-                    'type': 'Researcher',
-                    'training_need': need['type'],
-                    'priority': need['priority'],
-                    'estimated_duration': '2-3 weeks',
-                    'expected_outcome': f"Improve {need['type']} from {need['current']} to {need['target']}"
-                })
+        for need in researcher.training_opportunity['training_needs']:
+            yield need['priority'], partial(_research_training_record, researcher.name, need)
     
     # Development team training
-    for team_list in [dev_analysis['developers'], dev_analysis['designers'], dev_analysis['lead_developers']]:
-        for member in team_list:
-            if member['training_opportunities']['has_opportunities']:
-                for need in member['training_opportunities']['training_needs']:
-                    all_training_opportunities.append({
-                        'employee': member['name'],
-                        'type': member['type'],
-                        'training_need': need['type'],
-                        'priority': need['priority'],
-                        'estimated_duration': '1-2 weeks',
-                        'expected_outcome': 'Enhanced skill proficiency and productivity'
-                    })
-    
-    # Sort by priority
-    high_priority = [t for t in all_training_opportunities if t['priority'] == 'HIGH']
-    medium_priority = [t for t in all_training_opportunities if t['priority'] == 'MEDIUM']
+    for member in chain(dev_analysis['developers'], dev_analysis['designers'], dev_analysis['lead_developers']):
+        for need in member.training_opportunities['training_needs']:
+            yield need['priority'], partial(_training_record, member.name, member.type, need['type'],
+                                            need['priority'], '1-2 weeks',
+                                            'Enhanced skill proficiency and productivity')
+
+@st.cache_data(show_spinner=False, hash_funcs=SAVE_HASH_FUNCS)
+def generate_professional_development_plan(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Generate comprehensive professional development plan for all employees"""
+    
+    # Consolidate training opportunities straight into their priority buckets
+    high_priority = []
+    medium_priority = []
+    for priority, make_record in _training_opportunities(data):
+        (high_priority if priority == HIGH else medium_priority).append(make_record())
+    
+    total_training = len(high_priority) + len(medium_priority)
     
     return {
-        'total_training_opportunities': len(all_training_opportunities),
+        'total_training_opportunities': total_training,
         'high_priority_training': high_priority,
         'medium_priority_training': medium_priority,
-        'estimated_total_cost': len(all_training_opportunities) * 1000,
+        'estimated_total_cost': total_training * 1000,
         'recommended_schedule': generate_training_schedule(high_priority, medium_priority)
     }
 
-def generate_training_schedule(high_priority: List[Dict], medium_priority: List[Dict]) -> List[Dict[str, Any]]:
-    """Generate optimal training schedule"""
+@st.cache_data(show_spinner=False, hash_funcs=SAVE_HASH_FUNCS)
+def summarize_training_needs(data: Dict[str, Any]) -> Dict[str, int]:
+    """Headline counts of the development plan without building its records or schedule"""
     
-    schedule = []
-    current_week = 1
+    total = high = 0
+    for priority, _ in _training_opportunities(data):
+        total += 1
+        high += priority == HIGH
     
-    # Schedule high priority training first
-    for training in high_priority:
-        schedule.append({
-            'week': current_week,
-            'employee': training['employee'],
-            'training_type': training['training_need'],
-            'duration': training['estimated_duration'],
-            'priority': 'HIGH'
-        })
-        current_week += 2  # Assume 2 weeks per training
+    return {
+        'total_training_opportunities': total,
+        'high_priority_count': high,
+        'estimated_total_cost': total * 1000
+    }
+
+def generate_training_schedule(high_priority: List[Dict], medium_priority: List[Dict]) -> List[Dict[str, Any]]:
+    """Generate optimal training schedule"""
     
-    # Schedule medium priority training
-    for training in medium_priority[:5]:  # Limit to top 5 medium priority
-        schedule.append({
-            'week': current_week,
+    # High priority training first, then the top 5 medium priority;
+    # each training is assumed to take 2 weeks
+    trainings = chain(
+        ((HIGH, training) for training in high_priority),
+        ((MEDIUM, training) for training in medium_priority[:5])
+    )
+    return [
+        {
+            'week': 1 + 2 * slot,
             'employee': training['employee'],
             'training_type': training['training_need'],
             'duration': training['estimated_duration'],
-            'priority': 'MEDIUM'
-        })
-        current_week += 2
-    
-    return schedule
\ No newline at end of file
+            'priority': priority
+        }
+        for slot, (priority, training) in enumerate(trainings)
+    ]
\ No newline at end of file
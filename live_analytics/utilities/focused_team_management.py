@@ -5,67 +5,289 @@ Separates team members by their management needs and workflow types
 
 import json
 from datetime import datetime, timedelta
+from operator import itemgetter
 from typing import Dict, List, Any, Tuple
+import numpy as np
 import streamlit as st
 
-def analyze_manageable_team_members(data: Dict[str, Any]) -> Dict[str, Any]:
-    """Analyze only team members with adjustable work queues for daily standup"""
+from utilities.live_file_sync import SAVE_HASH_FUNCS, hash_save_data
+from utilities.save_records import extract_skills
+
+try:
+    from numba import njit
+except ImportError:  # Optional dependency - fall back to the NumPy scoring
+    njit = None
+
+# Roles that have adjustable work queues for daily standup
+MANAGEABLE_ROLES = frozenset({'Developer', 'Designer', 'LeadDeveloper', 'Marketer', 'SysAdmin'})
+
+# Filter out CEO and other special roles
+EXCLUDED_NAMES = frozenset({'Alex Corbin'})  # CEO
+
+# np.isin needs array operands, so keep sorted copies ready for the SoA filter
+_MANAGEABLE_ROLE_ARRAY = np.array(sorted(MANAGEABLE_ROLES), dtype=object)
+_EXCLUDED_NAME_ARRAY = np.array(sorted(EXCLUDED_NAMES), dtype=object)
+
+# Capacity multiplier per level code; unknown levels count as Beginner
+LEVEL_CODES = {'Beginner': 0, 'Intermediate': 1, 'Advanced': 2, 'Expert': 3}
+LEVEL_MULTIPLIERS = (1.0, 1.5, 2.0, 2.5)
+LEVEL_MULTIPLIER_LUT = np.array(LEVEL_MULTIPLIERS)
+
+# Labels for the integer codes produced by the scoring kernel
+EFFICIENCY_RATINGS = ('Low', 'Medium', 'High')
+TRAINING_NEED_LABELS = ('Primary skill improvement', 'Cross-skill development', 'Speed training')
+
+# Scoring thresholds shared by the NumPy and compiled kernels
+TASK_CAPACITY_UNIT = 0.5       # capacity needed per concurrent task
+MAX_CONCURRENT_TASKS = 3
+MEDIUM_EFFICIENCY_CAPACITY = 1.5
+HIGH_EFFICIENCY_CAPACITY = 2.0
+PRIMARY_SKILL_TARGET = 80      # below this the best skill needs training
+AVERAGE_SKILL_TARGET = 50      # below this the skill average needs cross-training
+SPEED_TARGET = 120
+
+# Teams smaller than this are scored with NumPy; the compiled loop only wins
+# once the office is large enough to amortize its first-call compile
+NUMBA_MIN_MEMBERS = 1_000
+
+# Profile fields copied onto each standup member, with their defaults
+_MEMBER_FIELDS = ('name', 'employeeTypeName', 'level', 'speed', 'salary', 'mood', 'effectiveness')
+_MEMBER_DEFAULTS = ('', '', 'Beginner', 0, 0, 50, 100)
+_get_member_fields = itemgetter(*_MEMBER_FIELDS)
+
+# Queue recommendation templates, formatted only for flagged members
+_OVERLOAD_MSG = "{} may be overloaded - consider reducing queue"
+_OVERLOAD_ACTION = "Review {}'s current assignments and redistribute if possible"
+_UNDERUSE_MSG = "{} has high capacity and is available"
+_UNDERUSE_ACTION = "Assign priority tasks to {} - can handle {}"
+_TRAINING_MSG = "{} is ready for skill development"
+_TRAINING_ACTION = "Schedule training: {}"
+
+# Research items and their costs (example - would need actual game data)
+_RESEARCH_NAMES = ('Basic Algorithm', 'Advanced UI', 'Security Framework', 'AI Components', 'Cloud Integration')
+_RESEARCH_COSTS = np.array([50, 150, 200, 300, 500], dtype=np.int32)
+_RESEARCH_PRIORITIES = ('HIGH', 'MEDIUM', 'HIGH', 'MEDIUM', 'LOW')
+_URGENCY_LABELS = ('AVAILABLE_NOW', 'AVAILABLE_SOON', 'MEDIUM_TERM', 'LONG_TERM')
+
+def _extract_employee_soa(workstations: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Struct-of-arrays view of the staffed workstations"""
+    
+    indices = []
+    employees = []
+    for i, workstation in enumerate(workstations):
+        emp = workstation.get('employee')
+        if emp:
+            indices.append(i)
+            employees.append(emp)
+    
+    count = len(employees)
+    return {
+        'employees': employees,
+        'workstation': np.fromiter(indices, dtype=np.int32, count=count),
+        'names': np.array([emp.get('name', '') for emp in employees], dtype=object),
+        'roles': np.array([emp.get('employeeTypeName', '') for emp in employees], dtype=object),
+        'speed': np.fromiter((emp.get('speed', 0) for emp in employees), dtype=np.float64, count=count),
+        'level_code': np.fromiter(
+            (LEVEL_CODES.get(emp.get('level', 'Beginner'), 0) for emp in employees), dtype=np.int8, count=count
+        )
+    }
+
+def _skill_matrix(skills_list: List[Dict[str, float]]) -> np.ndarray:
+    """Dense member x skill matrix; skills a member lacks are -inf so they never win a max"""
+    
+    columns = {}
+    for skills in skills_list:
+        for key in skills:
+            columns.setdefault(key, len(columns))
+    
+    matrix = np.full((len(skills_list), len(columns)), -np.inf)
+    for row, skills in enumerate(skills_list):
+        for key, value in skills.items():
+            matrix[row, columns[key]] = value
+    return matrix
+
+def _score_team_numpy(speed: np.ndarray, level_code: np.ndarray, skills: np.ndarray,
+                      has_task: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """Capacity and training scores for every member as NumPy expressions"""
+    
+    present = np.isfinite(skills)
+    skill_count = present.sum(axis=1)
+    has_skills = skill_count > 0
+    max_skill = skills.max(axis=1, initial=-np.inf)
+    avg_skill = np.where(present, skills, 0.0).sum(axis=1) / np.maximum(skill_count, 1)
+    
+    capacity = (speed / 100) * LEVEL_MULTIPLIER_LUT[level_code] * np.where(has_skills, 1 + (max_skill / 200), 1.0)
+    concurrent = np.minimum(np.trunc(capacity / TASK_CAPACITY_UNIT), MAX_CONCURRENT_TASKS).astype(np.int64)
+    efficiency_code = (capacity > MEDIUM_EFFICIENCY_CAPACITY).astype(np.int8) + (capacity > HIGH_EFFICIENCY_CAPACITY)
+    training_needs = np.column_stack((
+        has_skills & (max_skill < PRIMARY_SKILL_TARGET),
+        has_skills & (avg_skill < AVERAGE_SKILL_TARGET),
+        speed < SPEED_TARGET
+    ))
+    ready = ~has_task & training_needs.any(axis=1)
+    return capacity, concurrent, efficiency_code, training_needs, ready
+
+def _score_team_loop(speed, level_code, skills, has_task, level_multipliers):
+    """Same scores as _score_team_numpy as one fused loop, for compilation with Numba"""
+    
+    count, skill_columns = skills.shape
+    capacity = np.empty(count)
+    concurrent = np.empty(count, np.int64)
+    efficiency_code = np.empty(count, np.int8)
+    training_needs = np.zeros((count, 3), np.bool_)
+    ready = np.zeros(count, np.bool_)
+    for i in range(count):
+        max_skill = -np.inf
+        total_skill = 0.0
+        skill_count = 0
+        for k in range(skill_columns):
+            value = skills[i, k]
+            if value > -np.inf:
+                skill_count += 1
+                total_skill += value
+                if value > max_skill:
+                    max_skill = value
+        
+        skill_modifier = 1 + (max_skill / 200) if skill_count else 1.0
+        member_capacity = (speed[i] / 100) * level_multipliers[level_code[i]] * skill_modifier
+        capacity[i] = member_capacity
+        concurrent[i] = min(int(member_capacity / TASK_CAPACITY_UNIT), MAX_CONCURRENT_TASKS)
+        efficiency_code[i] = (2 if member_capacity > HIGH_EFFICIENCY_CAPACITY
+                              else 1 if member_capacity > MEDIUM_EFFICIENCY_CAPACITY else 0)
+        
+        if skill_count:
+            training_needs[i, 0] = max_skill < PRIMARY_SKILL_TARGET
+            training_needs[i, 1] = total_skill / skill_count < AVERAGE_SKILL_TARGET
+        training_needs[i, 2] = speed[i] < SPEED_TARGET
+        ready[i] = not has_task[i] and (training_needs[i, 0] or training_needs[i, 1] or training_needs[i, 2])
+    return capacity, concurrent, efficiency_code, training_needs, ready
+
+# Missing skills are -inf sentinels, so fastmath (which assumes finite values) stays off
+_score_team_jit = njit(cache=True)(_score_team_loop) if njit is not None else None
+
+def _score_team(speed: np.ndarray, level_code: np.ndarray, skills: np.ndarray,
+                has_task: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """Capacity, concurrency, efficiency code, training need flags and readiness per member"""
     
-    workstations = data.get('office', {}).get('workstations', [])
+    if _score_team_jit is not None and speed.size >= NUMBA_MIN_MEMBERS:
+        return _score_team_jit(speed, level_code, skills, has_task, LEVEL_MULTIPLIER_LUT)
+    return _score_team_numpy(speed, level_code, skills, has_task)
+
+def _partition_employees(data: Dict[str, Any]) -> Dict[str, Any]:
+    """One pass over the workstations: the SoA columns plus row indices per analysis"""
     
-    # Roles that have adjustable work queues for daily standup
-    manageable_roles = ['Developer', 'Designer', 'LeadDeveloper', 'Marketer', 'SysAdmin']
+    soa = _extract_employee_soa(data.get('office', {}).get('workstations', []))
+    roles = soa['roles']
+    return {
+        'soa': soa,
+        # Manageable roles, excluding the CEO
+        'manageable': np.flatnonzero(np.isin(roles, _MANAGEABLE_ROLE_ARRAY) & ~np.isin(soa['names'], _EXCLUDED_NAME_ARRAY)),
+        'researcher': np.flatnonzero(roles == 'Researcher')
+    }
+
+# run_team_analyses shares one _partition between the standup and research passes it runs
+@st.cache_data(show_spinner=False, hash_funcs=SAVE_HASH_FUNCS)
+def analyze_manageable_team_members(data: Dict[str, Any], _partition: Dict[str, Any] = None) -> Dict[str, Any]:
+    """Analyze only team members with adjustable work queues for daily standup"""
     
-    # Filter out CEO and other special roles
-    excluded_names = ['Alex Corbin']  # CEO
+    partition = _partition if _partition is not None else _partition_employees(data)
+    soa = partition['soa']
+    selected = partition['manageable']
+    employees = soa['employees']
+    members = [employees[k] for k in selected.tolist()]
     
-    manageable_team = []
+    # Extract skills for work queue analysis, then score everyone at once
+    member_skills = [extract_skills(emp) for emp in members]
+    has_task = np.fromiter((bool(emp.get('task', {})) for emp in members), dtype=np.bool_, count=len(members))
+    capacity, concurrent, efficiency_code, training_needs, ready = _score_team(
+        soa['speed'][selected], soa['level_code'][selected], _skill_matrix(member_skills), has_task
+    )
     
-    for i, workstation in enumerate(workstations):
-        if 'employee' in workstation and workstation['employee']:
-            emp = workstation['employee']
-            name = emp.get('name', '')
-            role = emp.get('employeeTypeName', '')
-            
-            # Include only manageable roles and exclude CEO
-            if role in manageable_roles and name not in excluded_names:
-                
-                # Extract skills for work queue analysis
-                skills = {}
-                for key, value in emp.items():
-                    if 'skill' in key.lower() and isinstance(value, (int, float)):
-                        skills[key] = value
-                
-                # Determine current work assignment
-                current_assignment = analyze_current_assignment(emp, data)
-                
-                # Calculate work queue capacity
-                queue_capacity = calculate_queue_capacity(emp, skills)
-                
-                team_member = {
-                    'name': name,
-                    'role': role,
-                    'level': emp.get('level', 'Beginner'),
-                    'speed': emp.get('speed', 0),
-                    'salary': emp.get('salary', 0),
-                    'workstation': i,
-                    'skills': skills,
-                    'current_assignment': current_assignment,
-                    'queue_capacity': queue_capacity,
-                    'mood': emp.get('mood', 50),
-                    'effectiveness': emp.get('effectiveness', 100),
-                    'training_status': assess_training_readiness(emp, skills)
-                }
-                
-                manageable_team.append(team_member)
+    manageable_team = []
+    total_capacity_sum = 0.0
+    for emp, skills, workstation, total_capacity, tasks, efficiency, needs, is_ready, busy in zip(
+        members, member_skills, soa['workstation'][selected].tolist(), capacity.tolist(),
+        concurrent.tolist(), efficiency_code.tolist(), training_needs.tolist(), ready.tolist(), has_task.tolist()
+    ):
+        member_needs = [label for label, needed in zip(TRAINING_NEED_LABELS, needs) if needed]
+        try:
+            name, role, level, speed, salary, mood, effectiveness = _get_member_fields(emp)
+        except KeyError:
+            name, role, level, speed, salary, mood, effectiveness = (
+                emp.get(key, default) for key, default in zip(_MEMBER_FIELDS, _MEMBER_DEFAULTS)
+            )
+        team_member = {
+            'name': name,
+            'role': role,
+            'level': level,
+            'speed': speed,
+            'salary': salary,
+            'workstation': workstation,
+            'skills': skills,
+            'current_assignment': analyze_current_assignment(emp, data),
+            'queue_capacity': {
+                'total_capacity': total_capacity,
+                'concurrent_tasks': tasks,
+                'efficiency_rating': EFFICIENCY_RATINGS[efficiency],
+                'recommended_workload': calculate_recommended_workload(total_capacity)
+            },
+            'mood': mood,
+            'effectiveness': effectiveness,
+            'training_status': {
+                'ready_for_training': is_ready,
+                'training_needs': member_needs,
+                'optimal_timing': 'After current assignment' if busy else 'Now',
+                'estimated_duration': len(member_needs) * 3  # days
+            }
+        }
+        
+        manageable_team.append(team_member)
+        total_capacity_sum += total_capacity
     
     return {
         'team_members': manageable_team,
-        'total_capacity': sum(tm['queue_capacity']['total_capacity'] for tm in manageable_team),
-        'work_distribution': analyze_work_distribution(manageable_team),
-        'queue_recommendations': generate_queue_recommendations(manageable_team)
+        'total_capacity': total_capacity_sum,
+        'work_distribution': analyze_work_distribution(manageable_team, soa['roles'][selected], capacity, has_task),
+        'queue_recommendations': generate_queue_recommendations(manageable_team, efficiency_code, has_task, ready)
     }
 
+class _TeamAnalyses(dict):
+    """Runs each team analysis on its first lookup, sharing one employee partition"""
+    
+    __slots__ = ('_data', '_partition')
+    
+    def __init__(self, data: Dict[str, Any]):
+        super().__init__()
+        self._data = data
+        self._partition = None
+    
+    def __missing__(self, name: str) -> Dict[str, Any]:
+        analyze = {
+            'standup': analyze_manageable_team_members,
+            'research': analyze_research_team_performance
+        }[name]
+        if self._partition is None:
+            self._partition = _partition_employees(self._data)
+        result = self[name] = analyze(self._data, self._partition)
+        return result
+
+def run_team_analyses(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Standup and research analyses, reused from session state while the save is unchanged
+    
+    Each analysis runs only when first indexed (``run_team_analyses(data)['standup']``).
+    st.cache_data hands back a fresh copy on every hit; this keeps the result
+    objects themselves across reruns, so callers must not mutate them.
+    """
+    
+    fingerprint = hash_save_data(data)
+    if st.session_state.get('_team_analysis_fp') == fingerprint:
+        return st.session_state['_team_analysis_cache']
+    
+    results = _TeamAnalyses(data)
+    st.session_state['_team_analysis_fp'] = fingerprint
+    st.session_state['_team_analysis_cache'] = results
+    return results
+
 def analyze_current_assignment(employee: Dict[str, Any], data: Dict[str, Any]) -> Dict[str, Any]:
     """Analyze what the employee is currently working on"""
     
@@ -87,34 +309,6 @@ def analyze_current_assignment(employee: Dict[str, Any], data: Dict[str, Any]) -
             'ready_for_work': True
         }
 
-def calculate_queue_capacity(employee: Dict[str, Any], skills: Dict[str, Any]) -> Dict[str, Any]:
-    """Calculate how much work this employee can handle in their queue"""
-    
-    speed = employee.get('speed', 0)
-    level = employee.get('level', 'Beginner')
-    
-    # Base capacity calculation
-    level_multiplier = {'Beginner': 1.0, 'Intermediate': 1.5, 'Advanced': 2.0, 'Expert': 2.5}.get(level, 1.0)
-    speed_factor = speed / 100  # Normalize speed
-    
-    base_capacity = speed_factor * level_multiplier
-    
-    # Skill-based capacity modifiers
-    if skills:
-        max_skill = max(skills.values())
-        skill_modifier = 1 + (max_skill / 200)  # Bonus for high skills
-    else:
-        skill_modifier = 1.0
-    
-    total_capacity = base_capacity * skill_modifier
-    
-    return {
-        'total_capacity': total_capacity,
-        'concurrent_tasks': min(int(total_capacity / 0.5), 3),  # Max 3 concurrent tasks
-        'efficiency_rating': 'High' if total_capacity > 2.0 else 'Medium' if total_capacity > 1.5 else 'Low',
-        'recommended_workload': calculate_recommended_workload(total_capacity)
-    }
-
 def calculate_recommended_workload(capacity: float) -> str:
     """Recommend optimal workload based on capacity"""
     
@@ -127,60 +321,44 @@ def calculate_recommended_workload(capacity: float) -> str:
     else:
         return "Should focus on 1 task at a time"
 
-def assess_training_readiness(employee: Dict[str, Any], skills: Dict[str, Any]) -> Dict[str, Any]:
-    """Assess if employee is ready for training during downtime"""
-    
-    current_assignment = employee.get('task', {})
-    has_active_work = bool(current_assignment)
-    
-    # Check skill gaps
-    training_needs = []
-    if skills:
-        max_skill = max(skills.values())
-        avg_skill = sum(skills.values()) / len(skills)
-        
-        if max_skill < 80:
-            training_needs.append('Primary skill improvement')
-        if avg_skill < 50:
-            training_needs.append('Cross-skill development')
-    
-    speed = employee.get('speed', 0)
-    if speed < 120:
-        training_needs.append('Speed training')
-    
-    return {
-        'ready_for_training': not has_active_work and len(training_needs) > 0,
-        'training_needs': training_needs,
-        'optimal_timing': 'Now' if not has_active_work else 'After current assignment',
-        'estimated_duration': len(training_needs) * 3  # days
-    }
-
-def analyze_work_distribution(team_members: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Analyze how work is distributed across the team"""
+def analyze_work_distribution(team_members: List[Dict[str, Any]], roles: np.ndarray = None,
+                              capacity: np.ndarray = None, has_task: np.ndarray = None) -> Dict[str, Any]:
+    """Analyze how work is distributed across the team
+    
+    The role, capacity and busy columns can be passed in; otherwise they are
+    read back from the member dicts.
+    """
+    
+    count = len(team_members)
+    if roles is None:
+        roles = np.array([m['role'] for m in team_members], dtype=object)
+        capacity = np.fromiter((m['queue_capacity']['total_capacity'] for m in team_members), dtype=np.float64, count=count)
+        has_task = np.fromiter((m['current_assignment']['has_assignment'] for m in team_members), dtype=np.bool_, count=count)
+    
+    # Tally per role code, keeping roles in order of first appearance
+    role_names, first_seen, role_codes = np.unique(roles, return_index=True, return_inverse=True)
+    order = np.argsort(first_seen, kind='stable')
+    role_codes = role_codes.reshape(-1)
+    counts = np.bincount(role_codes, minlength=len(role_names))[order]
+    total_capacity = np.bincount(role_codes, weights=capacity, minlength=len(role_names))[order]
+    busy = np.bincount(role_codes, weights=has_task, minlength=len(role_names)).astype(np.int64)[order]
+    
+    # Every tallied role has at least one member, so the rates are well defined
+    utilization_rate = (busy / counts) * 100
+    avg_capacity = total_capacity / counts
     
     role_distribution = {}
     capacity_utilization = {}
-    
-    for member in team_members:
-        role = member['role']
-        
-        if role not in role_distribution:
-            role_distribution[role] = {'count': 0, 'total_capacity': 0, 'busy_count': 0}
-        
-        role_distribution[role]['count'] += 1
-        role_distribution[role]['total_capacity'] += member['queue_capacity']['total_capacity']
-        
-        if member['current_assignment']['has_assignment']:
-            role_distribution[role]['busy_count'] += 1
-    
-    # Calculate utilization rates
-    for role, stats in role_distribution.items():
-        if stats['count'] > 0:
-            capacity_utilization[role] = {
-                'utilization_rate': (stats['busy_count'] / stats['count']) * 100,
-                'avg_capacity': stats['total_capacity'] / stats['count'],
-                'available_members': stats['count'] - stats['busy_count']
-            }
+    for role, role_count, role_capacity, busy_count, rate, avg in zip(
+        role_names[order].tolist(), counts.tolist(), total_capacity.tolist(), busy.tolist(),
+        utilization_rate.tolist(), avg_capacity.tolist()
+    ):
+        role_distribution[role] = {'count': role_count, 'total_capacity': role_capacity, 'busy_count': busy_count}
+        capacity_utilization[role] = {
+            'utilization_rate': rate,
+            'avg_capacity': avg,
+            'available_members': role_count - busy_count
+        }
     
     return {
         'role_distribution': role_distribution,
@@ -211,68 +389,77 @@ def identify_capacity_bottlenecks(utilization: Dict[str, Dict]) -> List[Dict[str
     
     return bottlenecks
 
-def generate_queue_recommendations(team_members: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """Generate recommendations for work queue management"""
-    
+def generate_queue_recommendations(team_members: List[Dict[str, Any]], efficiency_code: np.ndarray = None,
+                                   has_task: np.ndarray = None, ready: np.ndarray = None) -> List[Dict[str, Any]]:
+    """Generate recommendations for work queue management
+    
+    The scoring kernel's efficiency codes and flags can be passed in; otherwise
+    they are read back from the member dicts.
+    """
+    
+    count = len(team_members)
+    if efficiency_code is None:
+        efficiency_code = np.fromiter(
+            (EFFICIENCY_RATINGS.index(m['queue_capacity']['efficiency_rating']) for m in team_members),
+            dtype=np.int8, count=count
+        )
+        has_task = np.fromiter((m['current_assignment']['has_assignment'] for m in team_members), dtype=np.bool_, count=count)
+        ready = np.fromiter((m['training_status']['ready_for_training'] for m in team_members), dtype=np.bool_, count=count)
+    
+    # Overloaded members, underutilized members and training opportunities
+    overload = (efficiency_code == 0) & has_task
+    underuse = (efficiency_code == 2) & ~has_task
+    
+    # Only members with at least one flag get messages formatted
     recommendations = []
-    
-    # Analyze individual members
-    for member in team_members:
+    for k in np.flatnonzero(overload | underuse | ready).tolist():
+        member = team_members[k]
         name = member['name']
-        capacity = member['queue_capacity']
-        assignment = member['current_assignment']
-        training = member['training_status']
-        
-        # Overloaded members
-        if capacity['efficiency_rating'] == 'Low' and assignment['has_assignment']:
+        if overload[k]:
             recommendations.append({
                 'type': 'REDUCE_WORKLOAD',
                 'member': name,
                 'priority': 'HIGH',
-                'message': f"{name} may be overloaded - consider reducing queue",
-                'action': f"Review {name}'s current assignments and redistribute if possible"
+                'message': _OVERLOAD_MSG.format(name),
+                'action': _OVERLOAD_ACTION.format(name)
             })
-        
-        # Underutilized members
-        if capacity['efficiency_rating'] == 'High' and not assignment['has_assignment']:
+        if underuse[k]:
             recommendations.append({
                 'type': 'ADD_WORK',
                 'member': name,
                 'priority': 'MEDIUM',
-                'message': f"{name} has high capacity and is available",
-                'action': f"Assign priority tasks to {name} - can handle {capacity['recommended_workload']}"
+                'message': _UNDERUSE_MSG.format(name),
+                'action': _UNDERUSE_ACTION.format(name, member['queue_capacity']['recommended_workload'])
             })
-        
-        # Training opportunities
-        if training['ready_for_training']:
+        if ready[k]:
             recommendations.append({
                 'type': 'SCHEDULE_TRAINING',
                 'member': name,
                 'priority': 'LOW',
-                'message': f"{name} is ready for skill development",
-                'action': f"Schedule training: {', '.join(training['training_needs'])}"
+                'message': _TRAINING_MSG.format(name),
+                'action': _TRAINING_ACTION.format(', '.join(member['training_status']['training_needs']))
             })
     
     return recommendations
 
-def analyze_research_team_performance(data: Dict[str, Any]) -> Dict[str, Any]:
+@st.cache_data(show_spinner=False, hash_funcs=SAVE_HASH_FUNCS)
+def analyze_research_team_performance(data: Dict[str, Any], _partition: Dict[str, Any] = None) -> Dict[str, Any]:
     """Analyze research team performance and research point generation"""
     
-    workstations = data.get('office', {}).get('workstations', [])
+    partition = _partition if _partition is not None else _partition_employees(data)
+    employees = partition['soa']['employees']
     researchers = []
     
-    for workstation in workstations:
-        if 'employee' in workstation and workstation['employee']:
-            emp = workstation['employee']
-            if emp.get('employeeTypeName') == 'Researcher':
-                researchers.append({
-                    'name': emp.get('name'),
-                    'speed': emp.get('speed', 0),
-                    'level': emp.get('level', 'Beginner'),
-                    'research_skill': emp.get('researchSkill', 0),
-                    'salary': emp.get('salary', 0),
-                    'mood': emp.get('mood', 50)
-                })
+    for k in partition['researcher'].tolist():
+        emp = employees[k]
+        researchers.append({
+            'name': emp.get('name'),
+            'speed': emp.get('speed', 0),
+            'level': emp.get('level', 'Beginner'),
+            'research_skill': emp.get('researchSkill', 0),
+            'salary': emp.get('salary', 0),
+            'mood': emp.get('mood', 50)
+        })
     
     # Calculate research points per day
     total_research_speed = sum(r['speed'] for r in researchers)
@@ -310,39 +497,26 @@ def calculate_daily_research_generation(total_speed: float, researchers: List[Di
 def determine_research_priorities(current_points: int, daily_generation: float) -> List[Dict[str, Any]]:
     """Determine research priorities based on points and generation rate"""
     
-    priorities = []
-    
-    # Research items and their costs (example - would need actual game data)
-    research_items = [
-        {'name': 'Basic Algorithm', 'cost': 50, 'priority': 'HIGH'},
-        {'name': 'Advanced UI', 'cost': 150, 'priority': 'MEDIUM'},
-        {'name': 'Security Framework', 'cost': 200, 'priority': 'HIGH'},
-        {'name': 'AI Components', 'cost': 300, 'priority': 'MEDIUM'},
-        {'name': 'Cloud Integration', 'cost': 500, 'priority': 'LOW'}
-    ]
+    # Classify every research item in one vector pass
+    days_to_afford = _RESEARCH_COSTS / max(daily_generation, 1)
+    urgency_code = np.select(
+        [current_points >= _RESEARCH_COSTS, days_to_afford <= 7, days_to_afford <= 30],
+        [0, 1, 2], default=3
+    )
     
-    for item in research_items:
-        cost = item['cost']
-        days_to_afford = cost / max(daily_generation, 1)
-        
-        if current_points >= cost:
-            urgency = 'AVAILABLE_NOW'
-        elif days_to_afford <= 7:
-            urgency = 'AVAILABLE_SOON'
-        elif days_to_afford <= 30:
-            urgency = 'MEDIUM_TERM'
-        else:
-            urgency = 'LONG_TERM'
-        
-        priorities.append({
-            'item': item['name'],
+    return [
+        {
+            'item': name,
             'cost': cost,
-            'priority': item['priority'],
-            'urgency': urgency,
-            'days_to_afford': days_to_afford
-        })
-    
-    return priorities
+            'priority': priority,
+            'urgency': _URGENCY_LABELS[code],
+            'days_to_afford': days
+        }
+        for name, cost, priority, code, days in zip(
+            _RESEARCH_NAMES, _RESEARCH_COSTS.tolist(), _RESEARCH_PRIORITIES,
+            urgency_code.tolist(), days_to_afford.tolist()
+        )
+    ]
 
 def generate_research_training_recommendations(researchers: List[Dict[str, Any]], daily_generation: float) -> List[Dict[str, Any]]:
     """Generate training recommendations to improve research speed"""
@@ -5,177 +5,300 @@ Handles local game save monitoring and auto-refresh functionality
 
 import os
 import json
+import shutil
+import threading
 import time
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache
 import streamlit as st
-from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
+from streamlit import runtime
 
-# Game save file path - Use environment variable for flexibility in deployment
-import os
-GAME_SAVE_PATH = Path(os.environ.get(
-    'STARTUP_COMPANY_SAVE_PATH', 
-    r"C:\Users\patss\Saved Games\Startup Company\testing_v1\sg_momentum ai.json"
-))
+try:
+    import orjson
+except ImportError:  # Optional dependency - fall back to stdlib parser
+    orjson = None
+
+# Game save file path - Use environment variable for flexibility in deployment;
+# %USERPROFILE%-style variables in it are expanded
+GAME_SAVE_PATH = Path(os.path.expandvars(os.environ.get(
+    'STARTUP_COMPANY_SAVE_PATH',
+    str(Path.home() / "Saved Games" / "Startup Company" / "testing_v1" / "sg_momentum ai.json")
+)))
+
+# How often the monitor thread stats the game save for changes
+SYNC_POLL_SECONDS = 2.0
+
+# Cloud deployments never have the live save, so a missing one is re-checked at
+# most this often; the live-file branches below skip their stats in between
+LIVE_RECHECK_SECONDS = 30.0
+_live_state = (0.0, None)
 
 # Local save path - resolve relative to this file's directory
 _SCRIPT_DIR = Path(__file__).parent
 LOCAL_SAVE_PATH = _SCRIPT_DIR.parent / "save_data" / "sg_momentum ai.json"
 
-class GameSaveHandler(FileSystemEventHandler):
-    """Handler for game save file changes"""
+# Demo save copied into place when neither the game nor a backup is available
+DEMO_SAVE_PATH = _SCRIPT_DIR / "demo_save.json"
+
+def _parse_json_bytes(raw):
+    """Parse JSON from bytes or any bytes-like buffer, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(bytes(raw))
+
+def _looks_like_json_object(path, probe=64):
+    """Cheap completeness check: the file starts with '{' and ends with '}' (ignoring whitespace)"""
+    with open(path, 'rb') as f:
+        head = f.read(probe).lstrip()
+        f.seek(0, os.SEEK_END)
+        f.seek(max(f.tell() - probe, 0))
+        tail = f.read().rstrip()
+    return head.startswith(b'{') and tail.endswith(b'}')
+
+def _parse_json_file(path_str):
+    """Parse a JSON file, using orjson when available"""
+    with open(path_str, 'rb') as f:
+        return _parse_json_bytes(f.read())
+
+class SaveData(dict):
+    """A parsed save that carries its (path, mtime, size) fingerprint beside the keys
+    
+    Keeping the fingerprint out of the mapping means len(data) and key listings
+    match the file; it survives the pickle copies st.cache_data hands out.
+    """
+    
+    __slots__ = ('save_hash',)
+    
+    def __init__(self, *args, save_hash=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.save_hash = save_hash
+
+def _live_available():
+    """Whether the live game save exists; once found it stays available for the process"""
+    global _live_state
+    checked_at, available = _live_state
+    now = time.monotonic()
+    if not available and (available is None or now - checked_at >= LIVE_RECHECK_SECONDS):
+        available = GAME_SAVE_PATH.exists()
+        _live_state = (now, available)
+    return available
+
+def _safe_stat(path):
+    """os.stat that returns None instead of raising, replacing exists() + stat() pairs"""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+def _load_save(path_str, mtime_ns, size):
+    """Parse a save file and tag it with its (path, mtime, size) identity"""
+    data = _parse_json_file(path_str)
+    if isinstance(data, dict):
+        data = SaveData(data, save_hash=f"{path_str}:{mtime_ns}:{size}")
+    return data
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def _load_json_cached(path_str, mtime_ns, size):
+    """Parse a save file once per (path, mtime, size) so reruns skip the JSON parse"""
+    return _load_save(path_str, mtime_ns, size)
+
+@lru_cache(maxsize=2)
+def _load_json_memo(path_str, mtime_ns, size):
+    """Same cache for scripts running outside Streamlit; returns the shared dict, so don't mutate it"""
+    return _load_save(path_str, mtime_ns, size)
+
+def hash_save_data(data):
+    """st.cache_data hash for a save dict: the loader's fingerprint, else the dict's identity
+    
+    Saves from read_save_file are SaveData and always carry a fingerprint. Any
+    other dict is keyed on (id, top-level length) so a cache hit never walks the
+    whole save; mutating such a dict in place is not noticed.
+    """
+    return getattr(data, 'save_hash', None) or (id(data), len(data))
+
+# hash_funcs for analyzers cached per save file. st.cache_data matches them on
+# the exact type, so SaveData is listed as well as dict. Helper arguments
+# derived from the save (partitions, pre-bucketed employees) take a leading
+# underscore, which tells st.cache_data not to hash them; the save already
+# identifies the entry.
+SAVE_HASH_FUNCS = {SaveData: hash_save_data, dict: hash_save_data}
+
+@st.cache_data(show_spinner=False)
+def _summarize_json_cached(path_str, mtime_ns, size):
+    """Keep only the top-level (type name, length) of each key; the parsed tree is discarded"""
+    data = _parse_json_file(path_str)
+    return {
+        key: (type(value).__name__, len(value) if hasattr(value, '__len__') else None)
+        for key, value in data.items()
+    }
+
+def read_save_file(path, stat=None):
+    """Read a save file through the (mtime, size)-keyed cache; pass stat if already taken"""
+    if stat is None:
+        stat = os.stat(path)
+    loader = _load_json_cached if runtime.exists() else _load_json_memo
+    return loader(str(Path(path)), stat.st_mtime_ns, stat.st_size)
+
+def clear_save_file_cache():
+    """Drop cached save-file parses without touching other st.cache_data entries"""
+    _load_json_cached.clear()
+    _load_json_memo.cache_clear()
+    _summarize_json_cached.clear()
+
+def summarize_save_file(path):
+    """Return {key: (type name, length)} for a save file without keeping the full data around"""
+    stat = os.stat(path)
+    return _summarize_json_cached(str(Path(path)), stat.st_mtime_ns, stat.st_size)
+
+class GameSaveSync:
+    """Mirrors the game save into the local backup when its contents change"""
     
     def __init__(self):
-        self.last_modified = 0
-        
-    def on_modified(self, event):
-        if event.is_directory:
-            return
-            
-        if str(event.src_path).endswith("sg_momentum ai.json"):
-            current_time = time.time()
-            # Debounce rapid file changes (game may write multiple times)
-            # Increased debounce time to prevent excessive syncing
-            if current_time - self.last_modified > 3:
-                self.last_modified = current_time
-                self.sync_file()
+        # Source mtime of the last synced save
+        self._last_src_mtime = None
+    
+    def poll(self, stop_event, interval=SYNC_POLL_SECONDS):
+        """Sync every interval until stop_event is set; unchanged saves cost one stat"""
+        while not stop_event.wait(interval):
+            self.sync_file()
                 
     def sync_file(self):
         """Copy game save to local directory and trigger refresh"""
         try:
-            if GAME_SAVE_PATH.exists():
-                # Ensure local directory exists
-                LOCAL_SAVE_PATH.parent.mkdir(parents=True, exist_ok=True)
-                
-                # Copy file with validation
-                with open(GAME_SAVE_PATH, 'r') as src:
-                    data = json.load(src)  # Validate JSON
-                
-                with open(LOCAL_SAVE_PATH, 'w') as dst:
-                    json.dump(data, dst, indent=2)
-                
-                # Store sync timestamp
-                sync_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                with open("save_data/last_sync.txt", "w") as f:
-                    f.write(sync_time)
-                
-                # Note: Removed automatic st.rerun() to prevent infinite loops
-                # The dashboard will pick up changes on next manual interaction
+            try:
+                src_mtime = os.stat(GAME_SAVE_PATH).st_mtime_ns
+            except FileNotFoundError:
+                return
+            # Touches and repeated events leave the mtime alone; nothing new to copy
+            if src_mtime == self._last_src_mtime:
+                return
+            
+            # Ensure local directory exists
+            LOCAL_SAVE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            
+            # Let the OS copy the bytes into a temp file, sanity-check its ends,
+            # then swap it in atomically so readers never see a partial backup
+            tmp_path = LOCAL_SAVE_PATH.with_name(LOCAL_SAVE_PATH.name + '.tmp')
+            try:
+                shutil.copyfile(GAME_SAVE_PATH, tmp_path)
+                if not _looks_like_json_object(tmp_path):
+                    raise ValueError("game save looks truncated; will retry on the next poll")
+                os.replace(tmp_path, LOCAL_SAVE_PATH)
+            finally:
+                tmp_path.unlink(missing_ok=True)
+            
+            # Store sync timestamp
+            sync_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            with open("save_data/last_sync.txt", "w") as f:
+                f.write(sync_time)
+            self._last_src_mtime = src_mtime
+            
+            # Note: Removed automatic st.rerun() to prevent infinite loops
+            # The dashboard will pick up changes on next manual interaction
                     
         except Exception as e:
             print(f"Error syncing game save: {e}")
 
+@lru_cache(maxsize=1)
 def is_running_locally():
-    """Detect if running locally vs Streamlit Cloud"""
+    """Detect if running locally vs Streamlit Cloud; the verdict is fixed for the process"""
     # Check for local environment indicators
     local_indicators = [
-        os.path.exists(GAME_SAVE_PATH),  # Game save file exists
+        _live_available(),  # Game save file exists
         'STREAMLIT_SHARING' not in os.environ,  # Not on Streamlit Cloud
         'localhost' in os.environ.get('STREAMLIT_SERVER_ADDRESS', ''),
-        os.path.exists(r"C:\Users\patss"),  # Local user directory
+        GAME_SAVE_PATH.parent.parent.exists(),  # Startup Company saves folder
     ]
     
     return any(local_indicators)
 
+def _verify_save_file(path):
+    """Availability details for one save file from a single stat call"""
+    details = {'path': str(path), 'exists': False, 'readable': False, 'size': 0, 'modified': None}
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return details
+    except Exception as e:
+        details['error'] = str(e)
+        return details
+    
+    details['exists'] = True
+    details['size'] = stat.st_size
+    details['modified'] = datetime.fromtimestamp(stat.st_mtime).isoformat()
+    try:
+        _parse_json_file(path)  # Test if valid JSON
+        details['readable'] = True
+    except Exception as e:
+        details['error'] = str(e)
+    return details
+
 def verify_data_sources():
     """Debug function to check all data source availability"""
-    verification = {
-        'live_game_file': {
-            'path': str(GAME_SAVE_PATH),
-            'exists': GAME_SAVE_PATH.exists() if GAME_SAVE_PATH else False,
-            'readable': False,
-            'size': 0,
-            'modified': None
-        },
-        'local_backup': {
-            'path': str(LOCAL_SAVE_PATH),
-            'exists': LOCAL_SAVE_PATH.exists(),
-            'readable': False,
-            'size': 0,
-            'modified': None
-        },
+    return {
+        'live_game_file': _verify_save_file(GAME_SAVE_PATH),
+        'local_backup': _verify_save_file(LOCAL_SAVE_PATH),
         'environment': {
             'is_local': is_running_locally(),
             'streamlit_sharing': 'STREAMLIT_SHARING' in os.environ,
             'current_dir': str(Path.cwd())
         }
     }
-    
-    # Test live game file
-    if verification['live_game_file']['exists']:
-        try:
-            stat = GAME_SAVE_PATH.stat()
-            verification['live_game_file']['size'] = stat.st_size
-            verification['live_game_file']['modified'] = datetime.fromtimestamp(stat.st_mtime).isoformat()
-            with open(GAME_SAVE_PATH, 'r') as f:
-                json.load(f)  # Test if valid JSON
-            verification['live_game_file']['readable'] = True
-        except Exception as e:
-            verification['live_game_file']['error'] = str(e)
-    
-    # Test local backup
-    if verification['local_backup']['exists']:
-        try:
-            stat = LOCAL_SAVE_PATH.stat()
-            verification['local_backup']['size'] = stat.st_size
-            verification['local_backup']['modified'] = datetime.fromtimestamp(stat.st_mtime).isoformat()
-            with open(LOCAL_SAVE_PATH, 'r') as f:
-                json.load(f)  # Test if valid JSON
-            verification['local_backup']['readable'] = True
-        except Exception as e:
-            verification['local_backup']['error'] = str(e)
-    
-    return verification
+
+@lru_cache(maxsize=64)
+def _fmt_mtime(sec):
+    """Display string for a file mtime, cached per whole second"""
+    return datetime.fromtimestamp(sec).strftime("%Y-%m-%d %H:%M:%S")
+
+# Save mtimes don't move faster than the sync debounce, so reuse a recent answer
+FRESHNESS_TTL_SECONDS = 1.0
+_freshness_cache = (0.0, None)
 
 def get_data_freshness():
+    """Get timestamp of when data was last updated, re-checking the files at most once per TTL"""
+    global _freshness_cache
+    checked_at, timestamp = _freshness_cache
+    now = time.monotonic()
+    if timestamp is None or now - checked_at >= FRESHNESS_TTL_SECONDS:
+        timestamp = _read_data_freshness()
+        _freshness_cache = (now, timestamp)
+    return timestamp
+
+def _read_data_freshness():
     """Get timestamp of when data was last updated with source indication"""
-    freshness_info = {"timestamp": "No data available", "source": "none"}
-    
-    # Check live game file first (if local)
-    if is_running_locally() and GAME_SAVE_PATH.exists():
-        try:
-            mtime = GAME_SAVE_PATH.stat().st_mtime
-            freshness_info = {
-                "timestamp": datetime.fromtimestamp(mtime).strftime("%Y-%m-%d %H:%M:%S"),
-                "source": "live_game_file"
-            }
-        except Exception:
-            pass
     
-    # Fallback to local backup
-    if freshness_info["source"] == "none" and LOCAL_SAVE_PATH.exists():
-        try:
-            mtime = LOCAL_SAVE_PATH.stat().st_mtime
-            freshness_info = {
-                "timestamp": datetime.fromtimestamp(mtime).strftime("%Y-%m-%d %H:%M:%S"),
-                "source": "local_backup"
-            }
-        except Exception:
-            pass
-    
-    return freshness_info["timestamp"]
+    # Check live game file first (if local), then fall back to local backup
+    stat = _safe_stat(GAME_SAVE_PATH) if _live_available() and is_running_locally() else None
+    if stat is None:
+        stat = _safe_stat(LOCAL_SAVE_PATH)
+    if stat is None:
+        return "No data available"
+    return _fmt_mtime(int(stat.st_mtime))
 
 def setup_live_monitoring():
-    """Setup live file monitoring for local development"""
+    """Setup live file monitoring for local development
+    
+    Returns the (thread, stop_event) pair; set the event to stop monitoring.
+    """
     if not is_running_locally():
         return None
         
-    if not GAME_SAVE_PATH.exists():
+    if not _live_available() or not GAME_SAVE_PATH.exists():
         st.warning(f"Game save file not found: {GAME_SAVE_PATH}")
         return None
     
     # Initial sync
-    handler = GameSaveHandler()
-    handler.sync_file()
+    syncer = GameSaveSync()
+    syncer.sync_file()
     
-    # Setup file watcher
-    observer = Observer()
-    observer.schedule(handler, str(GAME_SAVE_PATH.parent), recursive=False)
+    # Poll the one file we care about instead of watching its whole directory
+    stop_event = threading.Event()
+    monitor = threading.Thread(target=syncer.poll, args=(stop_event,), name="save-monitor", daemon=True)
     
     try:
-        observer.start()
-        return observer
+        monitor.start()
+        return monitor, stop_event
     except Exception as e:
         st.error(f"Could not start file monitoring: {e}")
         return None
@@ -187,151 +310,16 @@ def ensure_backup_file_exists():
         LOCAL_SAVE_PATH.parent.mkdir(parents=True, exist_ok=True)
         
         # Try to copy from live game file if available
-        if is_running_locally() and GAME_SAVE_PATH.exists():
+        if _live_available() and is_running_locally() and GAME_SAVE_PATH.exists():
             try:
-                handler = GameSaveHandler()
-                handler.sync_file()
+                GameSaveSync().sync_file()
                 return True
             except Exception as e:
                 print(f"Could not sync from live game file: {e}")
         
-        # Create a realistic demo data file for cloud deployment
-        demo_data = {
-            "date": "2025-12-18T16:17:00.681Z",
-            "started": "2025-09-29T12:00:00.681Z",
-            "gameover": False,
-            "state": 1,
-            "paused": False,
-            "lastVersion": "1.24",
-            "balance": 227591.39,
-            "researchPoints": 15432,
-            "transactions": [
-                {
-                    "id": "demo-transaction-1",
-                    "day": 69,
-                    "hour": 0,
-                    "minute": 0,
-                    "amount": -434,
-                    "label": "Loan: Eazy Money",
-                    "balance": 79198.39
-                },
-                {
-                    "id": "demo-transaction-2", 
-                    "day": 69,
-                    "hour": 0,
-                    "minute": 0,
-                    "amount": 5000,
-                    "label": "Software Sales Revenue",
-                    "balance": 84198.39
-                }
-            ],
-            "inventory": {
-                "UiComponent": 15,
-                "BackendComponent": 8,
-                "DatabaseComponent": 12,
-                "GraphicsComponent": 5,
-                "NetworkComponent": 10
-            },
-            "featureInstances": [
-                {
-                    "id": "demo-feature-1",
-                    "featureName": "User Interface System",
-                    "activated": True,
-                    "requirements": {
-                        "UiComponent": 5,
-                        "GraphicsComponent": 3
-                    },
-                    "quality": {
-                        "current": 1200,
-                        "max": 2000
-                    },
-                    "efficiency": {
-                        "current": 800,
-                        "max": 1500
-                    },
-                    "pricePerMonth": 50
-                }
-            ],
-            "progress": {
-                "products": {
-                    "main_product": {
-                        "users": {
-                            "total": 15420,
-                            "satisfaction": 75,
-                            "conversionRate": 12.5,
-                            "potentialUsers": 50000
-                        },
-                        "stats": {
-                            "quality": 1200,
-                            "efficiency": 800,
-                            "valuation": 450000,
-                            "performance": {
-                                "state": "Good"
-                            }
-                        }
-                    }
-                }
-            },
-            "office": {
-                "workstations": [
-                    {
-                        "employee": {
-                            "name": "Alice Johnson",
-                            "employeeTypeName": "Developer",
-                            "level": "Intermediate",
-                            "speed": 120,
-                            "mood": 85,
-                            "queue": [
-                                {
-                                    "component": {
-                                        "name": "PaymentModule",
-                                        "type": "Module"
-                                    },
-                                    "state": "Running",
-                                    "totalMinutes": 480,
-                                    "completedMinutes": 240
-                                }
-                            ]
-                        }
-                    },
-                    {
-                        "employee": {
-                            "name": "Bob Smith", 
-                            "employeeTypeName": "Designer",
-                            "level": "Expert",
-                            "speed": 150,
-                            "mood": 90,
-                            "queue": []
-                        }
-                    }
-                ]
-            },
-            "employees": [
-                {
-                    "name": "Alice Johnson",
-                    "employeeTypeName": "Developer", 
-                    "level": "Intermediate",
-                    "speed": 120,
-                    "mood": 85
-                },
-                {
-                    "name": "Bob Smith",
-                    "employeeTypeName": "Designer",
-                    "level": "Expert", 
-                    "speed": 150,
-                    "mood": 90
-                }
-            ],
-            "meta": {
-                "created_by": "Project Phoenix Dashboard",
-                "note": "Demo data for portfolio showcase - live game integration available",
-                "data_type": "demo"
-            }
-        }
-        
+        # Fall back to the bundled demo save for cloud deployment
         try:
-            with open(LOCAL_SAVE_PATH, 'w') as f:
-                json.dump(demo_data, f, indent=2)
+            shutil.copyfile(DEMO_SAVE_PATH, LOCAL_SAVE_PATH)
             return True
         except Exception as e:
             print(f"Could not create demo backup file: {e}")
@@ -339,21 +327,65 @@ def ensure_backup_file_exists():
     
     return True
 
+# Alternative backup locations for cloud deployment, tried in order
+ALTERNATIVE_SAVE_PATHS = (
+    Path("save_data/sg_momentum ai.json"),  # Original relative path
+    Path("live_analytics/save_data/sg_momentum ai.json"),  # From project root
+    Path("../save_data/sg_momentum ai.json"),  # Up one level
+)
+
+# The live save once found; fallbacks are re-resolved so a live save appearing later wins
+_resolved_live_path = None
+
+def _resolve_data_path():
+    """(path, data source) of the first save that exists; only the live game file is remembered"""
+    global _resolved_live_path
+    if _resolved_live_path is not None:
+        return _resolved_live_path
+    candidates = [(GAME_SAVE_PATH, "live_game_file")] if _live_available() else []
+    candidates.append((LOCAL_SAVE_PATH, "local_backup"))
+    candidates.extend((alt_path, f"alternative_backup_{alt_path}") for alt_path in ALTERNATIVE_SAVE_PATHS)
+    for path, data_source in candidates:
+        if _safe_stat(path) is not None:
+            if data_source == "live_game_file":
+                _resolved_live_path = (path, data_source)
+            return path, data_source
+    return None
+
+def _forget_resolved_path():
+    """Drop the remembered live save after a failed read so the next load rescans"""
+    global _resolved_live_path
+    _resolved_live_path = None
+
 def load_game_data():
     """Load current game data with robust fallback system for cloud deployment"""
     
     # Ensure backup file exists for cloud deployment
     ensure_backup_file_exists()
     
+    # Fast path: the save resolved on an earlier call
+    resolved = _resolve_data_path()
+    if resolved is not None:
+        path, data_source = resolved
+        try:
+            data = read_save_file(path)
+        except Exception:
+            # Moved, deleted or mid-write: re-resolve and take the full scan below
+            _forget_resolved_path()
+        else:
+            if hasattr(st, 'session_state'):
+                st.session_state.data_source = data_source
+            return data
+    
     data = None
     data_source = "unknown"
     error_details = []
     
     # Priority 1: Read directly from game save file (if exists)
-    if GAME_SAVE_PATH.exists():
+    game_stat = _safe_stat(GAME_SAVE_PATH) if _live_available() else None
+    if game_stat is not None:
         try:
-            with open(GAME_SAVE_PATH, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = read_save_file(GAME_SAVE_PATH, game_stat)
             data_source = "live_game_file"
             
         except Exception as e:
@@ -365,14 +397,13 @@ def load_game_data():
     # Priority 2: Fallback to local backup copy
     if data is None:
         # Check if backup file exists and log path for debugging
-        backup_exists = LOCAL_SAVE_PATH.exists()
+        backup_stat = _safe_stat(LOCAL_SAVE_PATH)
         error_details.append(f"Checking backup at: {LOCAL_SAVE_PATH.absolute()}")
-        error_details.append(f"Backup exists: {backup_exists}")
+        error_details.append(f"Backup exists: {backup_stat is not None}")
         
-        if backup_exists:
+        if backup_stat is not None:
             try:
-                with open(LOCAL_SAVE_PATH, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                data = read_save_file(LOCAL_SAVE_PATH, backup_stat)
                 data_source = "local_backup"
                 
             except Exception as e:
@@ -382,17 +413,11 @@ def load_game_data():
     
     # Priority 3: Try alternative backup locations for cloud deployment
     if data is None:
-        alternative_paths = [
-            Path("save_data/sg_momentum ai.json"),  # Original relative path
-            Path("live_analytics/save_data/sg_momentum ai.json"),  # From project root
-            Path("../save_data/sg_momentum ai.json"),  # Up one level
-        ]
-        
-        for alt_path in alternative_paths:
-            if alt_path.exists():
+        for alt_path in ALTERNATIVE_SAVE_PATHS:
+            alt_stat = _safe_stat(alt_path)
+            if alt_stat is not None:
                 try:
-                    with open(alt_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
+                    data = read_save_file(alt_path, alt_stat)
                     data_source = f"alternative_backup_{alt_path}"
                     error_details.append(f"Found backup at: {alt_path.absolute()}")
                     break
@@ -421,11 +446,7 @@ def load_game_data():
             st.write(f"• {Path.cwd().absolute()}")
             
             st.write("**File Search Locations:**")
-            all_paths = [GAME_SAVE_PATH, LOCAL_SAVE_PATH] + [
-                Path("save_data/sg_momentum ai.json"),
-                Path("live_analytics/save_data/sg_momentum ai.json"),
-                Path("../save_data/sg_momentum ai.json"),
-            ]
+            all_paths = [GAME_SAVE_PATH, LOCAL_SAVE_PATH, *ALTERNATIVE_SAVE_PATHS]
             for path in all_paths:
                 exists = path.exists()
                 st.write(f"• {path.absolute()} - {'✅ EXISTS' if exists else '❌ NOT FOUND'}")
@@ -449,29 +470,22 @@ def get_environment_status():
     else:
         data_source_display = "Not loaded"
     
+    # Stat each save once and reuse the results below
+    game_stat = _safe_stat(GAME_SAVE_PATH) if _live_available() else None
+    backup_stat = _safe_stat(LOCAL_SAVE_PATH)
+    
     # Get file freshness
-    freshness = "Unknown"
-    if GAME_SAVE_PATH.exists():
-        try:
-            mtime = GAME_SAVE_PATH.stat().st_mtime
-            freshness = datetime.fromtimestamp(mtime).strftime("%Y-%m-%d %H:%M:%S")
-        except Exception:
-            pass
-    elif LOCAL_SAVE_PATH.exists():
-        try:
-            mtime = LOCAL_SAVE_PATH.stat().st_mtime
-            freshness = datetime.fromtimestamp(mtime).strftime("%Y-%m-%d %H:%M:%S")
-        except Exception:
-            pass
+    freshness_stat = game_stat if game_stat is not None else backup_stat
+    freshness = _fmt_mtime(int(freshness_stat.st_mtime)) if freshness_stat is not None else "Unknown"
     
     status = {
         'environment': 'Direct Game File Access',
         'data_source': data_source_display,
-        'data_source_detail': f"Reading from: {GAME_SAVE_PATH}" if GAME_SAVE_PATH.exists() else f"Fallback: {LOCAL_SAVE_PATH}",
+        'data_source_detail': f"Reading from: {GAME_SAVE_PATH}" if game_stat is not None else f"Fallback: {LOCAL_SAVE_PATH}",
         'last_updated': freshness,
         'auto_sync': False,  # No auto-refresh
-        'live_file_available': GAME_SAVE_PATH.exists(),
-        'backup_available': LOCAL_SAVE_PATH.exists()
+        'live_file_available': game_stat is not None,
+        'backup_available': backup_stat is not None
     }
     
     return status
\ No newline at end of file
@@ -0,0 +1,26 @@
+"""
+Save Record Helpers
+Small normalizers for employee and inventory records shared by the analysis modules
+"""
+
+from functools import lru_cache
+
+@lru_cache(maxsize=64)
+def _skill_keys(keys):
+    """Keys naming a skill; save files share a few record layouts, so cache per layout"""
+    return tuple(key for key in keys if 'skill' in key.lower())
+
+def extract_skills(emp):
+    """Numeric skill fields of an employee record"""
+    skill_keys = _skill_keys(tuple(emp))
+    if not skill_keys:
+        # Records without any skill-named key need no per-field type checks
+        return {}
+    return {key: emp[key] for key in skill_keys if isinstance(emp[key], (int, float))}
+
+def flatten_inventory(inventory):
+    """Normalize inventory entries to {name: amount}; dict entries contribute their 'amount'"""
+    return {
+        name: (value.get('amount', 0) if isinstance(value, dict) else value)
+        for name, value in inventory.items()
+    }
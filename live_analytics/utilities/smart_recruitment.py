@@ -3,37 +3,47 @@ Smart Recruitment System
 Analyzes capacity gaps and provides targeted hiring recommendations
 """
 
+import heapq
 import json
+from operator import itemgetter
 from typing import Dict, List, Any, Tuple
 import streamlit as st
 
+from utilities.live_file_sync import SAVE_HASH_FUNCS
+
+# Roles tracked for hiring, in display order
+HIRING_ROLES = ('Developer', 'Designer', 'LeadDeveloper', 'Researcher', 'SalesExecutive', 'Marketer')
+
+# Layout of the per-member tuples in analyze_hiring_needs()['current_team']
+TEAM_MEMBER_FIELDS = ('name', 'speed', 'level', 'salary')
+
+# Candidate scoring tables; unknown levels and ratings score as the lowest tier
+LEVEL_SCORES = {'Expert': 4, 'Advanced': 3, 'Intermediate': 2, 'Beginner': 1}
+SPEED_POINTS = {'EXCELLENT': 4, 'GOOD': 3, 'AVERAGE': 2, 'BELOW_AVERAGE': 1}
+VALUE_POINTS = {'EXCELLENT_VALUE': 4, 'GOOD_VALUE': 3, 'FAIR_VALUE': 2, 'EXPENSIVE': 1}
+
+# Shortlist order for overall recommendations; PASS candidates are never shortlisted
+RECOMMENDATION_TIERS = {'INSTANT_HIRE': 0, 'STRONG_CANDIDATE': 1, 'CONSIDER': 2}
+
+# Only office.workstations, inventory and Features are read, so the result is
+# cached per save file; reruns skip walking the (transaction-heavy) save again.
+@st.cache_data(show_spinner=False, hash_funcs=SAVE_HASH_FUNCS)
 def analyze_hiring_needs(data: Dict[str, Any]) -> Dict[str, Any]:
     """Analyze current workforce and determine specific hiring needs"""
     
     # Get current team composition
     workstations = data.get('office', {}).get('workstations', [])
     
-    # Analyze current team by role
-    current_team = {
-        'Developer': [],
-        'Designer': [],
-        'LeadDeveloper': [],
-        'Researcher': [],
-        'SalesExecutive': [],
-        'Marketer': []
-    }
+    # Analyze current team by role; members are TEAM_MEMBER_FIELDS tuples
+    current_team = {role: [] for role in HIRING_ROLES}
     
     for workstation in workstations:
-        if 'employee' in workstation and workstation['employee']:
-            emp = workstation['employee']
-            role = emp.get('employeeTypeName', 'Unknown')
-            if role in current_team:
-                current_team[role].append({
-                    'name': emp.get('name'),
-                    'speed': emp.get('speed', 0),
-                    'level': emp.get('level', 'Beginner'),
-                    'salary': emp.get('salary', 0)
-                })
+        emp = workstation.get('employee')
+        if not emp:
+            continue
+        members = current_team.get(emp.get('employeeTypeName', 'Unknown'))
+        if members is not None:
+            members.append((emp.get('name'), emp.get('speed', 0), emp.get('level', 'Beginner'), emp.get('salary', 0)))
     
     # Analyze inventory and production needs
     inventory_analysis = analyze_inventory_needs(data)
@@ -114,13 +124,16 @@ def determine_hiring_priorities(current_team: Dict[str, List], inventory_analysi
             'priority_score': 100
         })
     
+    # Every priority so far is URGENT; low inventory for those roles is already covered
+    urgent_roles = {p['role'] for p in priorities}
+    
     # Check for low inventory situations
     for low_item in inventory_analysis['low_inventory']:
         builder_role = low_item['builder_role']
         current_capacity = len(current_team.get(builder_role, []))
         
         # Only add if not already covered by critical shortage
-        if not any(p['role'] == builder_role and p['urgency'] == 'URGENT' for p in priorities):
+        if builder_role not in urgent_roles:
             priorities.append({
                 'role': builder_role,
                 'reason': f"Low inventory: {low_item['component']} ({low_item['current_stock']} in stock)",
@@ -151,7 +164,7 @@ def determine_hiring_priorities(current_team: Dict[str, List], inventory_analysi
         })
     
     # Sort by priority score
-    priorities.sort(key=lambda x: x['priority_score'], reverse=True)
+    priorities.sort(key=itemgetter('priority_score'), reverse=True)
     
     return priorities
 
@@ -191,32 +204,32 @@ def generate_hiring_recommendations(hiring_priorities: List[Dict[str, Any]]) ->
     
     return recommendations
 
+def _candidate_summary(candidate: Dict[str, Any]) -> Dict[str, Any]:
+    """Display payload for one candidate, including its hiring assessment"""
+    
+    return {
+        'name': candidate.get('name'),
+        'level': candidate.get('level', 'Beginner'),
+        'speed': candidate.get('speed', 0),
+        'expected_salary': candidate.get('salary', 0),
+        'hire_recommendation': assess_candidate_value(candidate)
+    }
+
 def filter_candidates_by_role(candidates: List[Dict[str, Any]], target_role: str) -> List[Dict[str, Any]]:
     """Filter candidates to only show those matching the target role"""
     
-    filtered_candidates = []
-    
-    for candidate in candidates:
-        if candidate.get('employeeTypeName') == target_role:
-            filtered_candidates.append({
-                'name': candidate.get('name'),
-                'level': candidate.get('level', 'Beginner'),
-                'speed': candidate.get('speed', 0),
-                'expected_salary': candidate.get('salary', 0),
-                'hire_recommendation': assess_candidate_value(candidate)
-            })
+    filtered_candidates = [
+        _candidate_summary(candidate) for candidate in candidates
+        if candidate.get('employeeTypeName') == target_role
+    ]
     
     # Sort by speed (highest first) for top performers
-    filtered_candidates.sort(key=lambda x: x['speed'], reverse=True)
+    filtered_candidates.sort(key=itemgetter('speed'), reverse=True)
     
     return filtered_candidates
 
-def assess_candidate_value(candidate: Dict[str, Any]) -> Dict[str, Any]:
-    """Assess the hiring value of a candidate"""
-    
-    speed = candidate.get('speed', 0)
-    level = candidate.get('level', 'Beginner')
-    salary = candidate.get('salary', 0)
+def _rate_candidate(speed: float, level: str, salary: float) -> Tuple[str, int, str, float]:
+    """(speed rating, level score, value rating, value ratio) for a candidate's stats"""
     
     # Speed-based assessment
     if speed >= 150:
@@ -229,7 +242,7 @@ def assess_candidate_value(candidate: Dict[str, Any]) -> Dict[str, Any]:
         speed_rating = 'BELOW_AVERAGE'
     
     # Level-based assessment
-    level_score = {'Expert': 4, 'Advanced': 3, 'Intermediate': 2, 'Beginner': 1}.get(level, 1)
+    level_score = LEVEL_SCORES.get(level, 1)
     
     # Value calculation (speed per salary dollar)
     value_ratio = speed / max(salary, 1000)  # Avoid division by zero
@@ -243,6 +256,15 @@ def assess_candidate_value(candidate: Dict[str, Any]) -> Dict[str, Any]:
     else:
         value_rating = 'EXPENSIVE'
     
+    return speed_rating, level_score, value_rating, value_ratio
+
+def assess_candidate_value(candidate: Dict[str, Any]) -> Dict[str, Any]:
+    """Assess the hiring value of a candidate"""
+    
+    speed_rating, level_score, value_rating, value_ratio = _rate_candidate(
+        candidate.get('speed', 0), candidate.get('level', 'Beginner'), candidate.get('salary', 0)
+    )
+    
     return {
         'speed_rating': speed_rating,
         'level_score': level_score,
@@ -254,13 +276,8 @@ def assess_candidate_value(candidate: Dict[str, Any]) -> Dict[str, Any]:
 def calculate_overall_recommendation(speed_rating: str, level_score: int, value_rating: str) -> str:
     """Calculate overall hiring recommendation"""
     
-    # Speed weight
-    speed_points = {'EXCELLENT': 4, 'GOOD': 3, 'AVERAGE': 2, 'BELOW_AVERAGE': 1}[speed_rating]
-    
-    # Value weight
-    value_points = {'EXCELLENT_VALUE': 4, 'GOOD_VALUE': 3, 'FAIR_VALUE': 2, 'EXPENSIVE': 1}[value_rating]
-    
-    total_score = speed_points + level_score + value_points
+    # Speed and value weights
+    total_score = SPEED_POINTS.get(speed_rating, 1) + level_score + VALUE_POINTS.get(value_rating, 1)
     
     if total_score >= 10:
         return 'INSTANT_HIRE'
@@ -271,20 +288,30 @@ def calculate_overall_recommendation(speed_rating: str, level_score: int, value_
     else:
         return 'PASS'
 
+def _score_candidates_iter(candidates: List[Dict[str, Any]], target_role: str):
+    """Yield (tier, -speed, index, candidate) for role matches worth shortlisting
+    
+    Smaller keys rank higher: better tier first, then faster, then the
+    candidate's original position, matching the speed-sorted tier order.
+    """
+    
+    for index, candidate in enumerate(candidates):
+        if candidate.get('employeeTypeName') != target_role:
+            continue
+        speed = candidate.get('speed', 0)
+        speed_rating, level_score, value_rating, _ = _rate_candidate(
+            speed, candidate.get('level', 'Beginner'), candidate.get('salary', 0)
+        )
+        tier = RECOMMENDATION_TIERS.get(calculate_overall_recommendation(speed_rating, level_score, value_rating))
+        if tier is not None:
+            yield tier, -speed, index, candidate
+
 def get_top_candidates_for_role(candidates: List[Dict[str, Any]], target_role: str, count: int = 3) -> List[Dict[str, Any]]:
     """Get the top N candidates for a specific role with hiring recommendations"""
     
-    filtered_candidates = filter_candidates_by_role(candidates, target_role)
-    
-    # Get top candidates by overall recommendation
-    instant_hires = [c for c in filtered_candidates if c['hire_recommendation']['overall_recommendation'] == 'INSTANT_HIRE']
-    strong_candidates = [c for c in filtered_candidates if c['hire_recommendation']['overall_recommendation'] == 'STRONG_CANDIDATE']
-    consider_candidates = [c for c in filtered_candidates if c['hire_recommendation']['overall_recommendation'] == 'CONSIDER']
-    
-    # Combine in priority order
-    top_candidates = (instant_hires + strong_candidates + consider_candidates)[:count]
-    
-    return top_candidates
+    # Rank without building payloads, then summarize only the winners
+    shortlist = heapq.nsmallest(count, _score_candidates_iter(candidates, target_role))
+    return [_candidate_summary(candidate) for *_, candidate in shortlist]
 
 def generate_instant_hire_suggestion(hiring_needs: Dict[str, Any], candidates: List[Dict[str, Any]]) -> Dict[str, Any]:
     """Generate instant hire suggestions for urgent needs"""
@@ -125,7 +125,7 @@ class SaveFileHandler(FileSystemEventHandler):
             }
             
             with open(TRIGGER_FILE, 'w', encoding='utf-8') as f:
-                json.dump(trigger_data, f, indent=2)
+                json.dump(trigger_data, f, separators=(',', ':'))
                 
             print(f"[{datetime.now().strftime('%H:%M:%S')}] 🔄 Dashboard update triggered")
             